@@ -12,9 +12,10 @@ class Range:
         
         """
         # TODO: Fix input arguments.
-        if len(args) is 1:
+        n = len(args)
+        if n == 1:
             lower, upper = args[0]
-        elif len(args) is 2:
+        elif n == 2:
             lower, upper = args
         else:
             raise ValueError(
@@ -55,17 +56,32 @@ class BoundingBox:
     
     def __init__(self, n, s, w, e, dtype=float):
         """Create a BoundingBox with bounds"""
-        self._arr = np.array([n, s, w, e],dtype=dtype)
         self._dtype = dtype
         self._n, self._s, self._w, self._e = n, s, w, e
+
+    @property
+    def nswe(self):
+        """The bounds as a (n, s, w, e) numpy array (built on demand;
+        the constructor only stores scalars)."""
+        return np.array([self._n, self._s, self._w, self._e],
+                        dtype=self._dtype)
     
     @staticmethod
     def from_bool_img(boolimg):
         """Create a BoundingBox for all True pixels in a 2d bool image."""
-        assert( len(boolimg.shape) is 2  and  boolimg.dtype=='bool')
-        y,x = np.where(boolimg)
-        return BoundingBox(y.min(), y.max(), x.min(), x.max(), dtype=int)
-        
+        assert( len(boolimg.shape) == 2  and  boolimg.dtype=='bool')
+        # Reduce each axis instead of materializing the coordinates of
+        # every True pixel (np.where) just to take min/max of them.
+        rows = boolimg.any(axis=1)
+        cols = boolimg.any(axis=0)
+        if not rows.any():
+            raise ValueError('boolimg contains no True pixels.')
+        y0 = int(rows.argmax())
+        y1 = int(rows.size - 1 - rows[::-1].argmax())
+        x0 = int(cols.argmax())
+        x1 = int(cols.size - 1 - cols[::-1].argmax())
+        return BoundingBox(y0, y1, x0, x1, dtype=int)
+
     
     @property
     def n(self):
@@ -89,7 +105,7 @@ class BoundingBox:
     
     @property
     def shape(self):
-        if self._dtype is not int:
+        if self._dtype != int:
             raise AttributeError("non-int BoundingBoxes do not have a shape.")
         
         return abs(self.n - self.s) + 1, abs(self.w - self.e) + 1
@@ -121,11 +137,52 @@ class BoundingBox:
     
     
     def __contains__(self, yx):
-        return ((self.n >= yx[0]) & (self.s <= yx[0]) &
-                (self.w <= yx[1]) & (self.e >= yx[1]))
-    
-        
+        y, x = yx[0], yx[1]
+        if isinstance(y, np.ndarray) or isinstance(x, np.ndarray):
+            # Keep the vectorized form for arrays of coordinates.
+            return (self.n >= y) & (self.s <= y) & (self.w <= x) & (self.e >= x)
+        # Scalars short-circuit: on average fewer than 4 comparisons run.
+        return self.n >= y and self.s <= y and self.w <= x and self.e >= x
+
+
     def __call__(self, yx):
         """Test 'in'-ness of a yx"""
-        return ((self.n >= yx[0]) & (self.s <= yx[0]) &
-                (self.w <= yx[1]) & (self.e >= yx[1]))
+        return self.__contains__(yx)
+
+
+    def contains_points(self, yx):
+        """Test many points against this BoundingBox at once.
+
+        Args
+        ----
+        yx : numpy array with shape (..., 2)
+            Points as (y, x) pairs along the last axis.
+
+        Returns a bool array of shape yx.shape[:-1], True where the
+        point falls inside the (inclusive) bounds.
+        """
+        yx = np.asarray(yx)
+        y, x = yx[..., 0], yx[..., 1]
+        return (self.n >= y) & (self.s <= y) & (self.w <= x) & (self.e >= x)
+
+
+    @staticmethod
+    def contains_batch(bboxes_nswe, yx):
+        """Test many points against many boxes with broadcasting.
+
+        Args
+        ----
+        bboxes_nswe : numpy array with shape (B, 4)
+            One (n, s, w, e) row per box (see the nswe property).
+        yx : numpy array with shape (P, 2)
+            Points as (y, x) pairs.
+
+        Returns a (B, P) bool array; element [b, p] is True when point
+        p falls inside box b. All B*P tests run in four vectorized
+        comparisons instead of a Python double loop.
+        """
+        bboxes_nswe, yx = np.asarray(bboxes_nswe), np.asarray(yx)
+        n, s = bboxes_nswe[:, 0:1], bboxes_nswe[:, 1:2]
+        w, e = bboxes_nswe[:, 2:3], bboxes_nswe[:, 3:4]
+        y, x = yx[:, 0], yx[:, 1]
+        return (n >= y) & (s <= y) & (w <= x) & (e >= x)
@@ -27,8 +27,8 @@ InheritingClass must define:
         Maybe include some or all of the Attributes, as well as custom fields
         defined in the inheriting class. Must be members of instance.__dict__.
     
-    determine_file(d) - A static method of InheritingClass that takes a dict
-        that maps field_names into the actual values for that field. It returns
+    determine(*fields) - A static method of InheritingClass that takes the
+        values of the fields (in the order given by 'fields') and returns
         a path to a remote file.
 """
 
@@ -39,29 +39,63 @@ def match(x,y):
 
 """Base class for platform-specific File objects."""
 class BaseFile:
-    
+
+    # Instance state lives in slots: catalog scans create 10^4-10^5
+    # File objects, and slots cut the per-instance __dict__ overhead
+    # and make attribute access a C-level descriptor lookup.
+    # (Subclasses should declare __slots__ = () to keep the savings.)
+    __slots__ = ('_is_determined', '_is_local', '_is_valid', '_path',
+                 '_filename', '_shape', '_tile', '_date', '_product',
+                 '_key_cache', '_hash_cache', '_derived_cache')
+
     """Attributes that will not change over the life of a BaseFile"""
     #_is_spec = False # Is File is fully specified (all fields are not None)?
     _is_deterministic = False # *CAN* the filename/path be determined *ONLY* from fields?
     _platform = None # str
-    
-    """Attributes that may change if not is_deterministic."""
-    _is_determined = False # Has the filename/remotepath/path been determined?
-    
-    """Attributes that may change."""
-    _is_local = False # Does the file exist locally?
-    _is_valid = False # Do we know that this file actually exists somewhere?
-    _path = None     # str
-    _filename = None # str
-    _shape = (0,)
-    
-    """Some common attributes for RS Files:"""
-    _tile = None
-    _date = None
-    _product = None
-    
-    def __init__(self):
-        pass
+
+    """Per-slot defaults, applied by __init__ for any slot the subclass
+    has not already filled in."""
+    _defaults = (
+        ('_is_determined', False),  # Has the filename/remotepath/path been determined?
+        ('_is_local', False),       # Does the file exist locally?
+        ('_is_valid', False),       # Do we know that this file actually exists somewhere?
+        ('_path', None),            # str
+        ('_filename', None),        # str
+        ('_shape', (0,)),
+        # Some common attributes for RS Files:
+        ('_tile', None),
+        ('_date', None),
+        ('_product', None),
+        # Caches for the field tuple, hash and path-derived components
+        # (computed on first use):
+        ('_key_cache', None),
+        ('_hash_cache', None),
+        ('_derived_cache', None),   # (path, filename, extension, folder, is_local)
+    )
+
+    def __init__(self, is_valid=False):
+        for name, default in self._defaults:
+            if not hasattr(self, name):
+                setattr(self, name, default)
+        if is_valid:
+            self._is_valid = True
+
+    def __getstate__(self):
+        # Pickle only the slots that are actually set on the instance.
+        # Going through the slot descriptors skips slots shadowed by a
+        # subclass class-attribute (e.g. a fixed _shape).
+        state = {}
+        for name in BaseFile.__slots__:
+            descriptor = BaseFile.__dict__[name]
+            try:
+                state[name] = descriptor.__get__(self, type(self))
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            BaseFile.__dict__[name].__set__(self, value)
     
     def validate(self):
         raise NotImplementedError('Inheriting FileClass'
@@ -69,13 +103,38 @@ class BaseFile:
     
     def determine(self):
         raise NotImplementedError('Inheriting FileClass'
-            'must implement "determine_file()"')
-    
+            'must implement "determine(*fields)"')
+    
+    def _finalize_path(self):
+        """Compute and cache the components derived from the path.
+        The cache is keyed on the current _path object, so it refreshes
+        itself if the path is re-pointed (e.g. by grab)."""
+        p = self.path
+        is_local = not p.startswith(('http://', 'ftp://'))
+        if is_local:
+            filename = os.path.basename(p)
+        else:
+            filename = p.rsplit('/', 1)[-1]
+        extension = os.path.splitext(p)[1].lstrip('.').lower()
+        folder = os.path.split(p)[0]
+        self._derived_cache = (p, filename, extension, folder, is_local)
+        return self._derived_cache
+
+
+    @property
+    def _derived(self):
+        """The cached (path, filename, extension, folder, is_local)."""
+        d = self._derived_cache
+        if d is None or d[0] is not self._path:
+            d = self._finalize_path()
+        return d
+
+
     @property
     def is_local(self):
         """Is this File stored locally?"""
-        return not self.path.startswith(('http://', 'ftp://'))
-    
+        return self._derived[4]
+
     
     @property
     def is_remote(self):
@@ -98,7 +157,7 @@ class BaseFile:
     @property
     def is_spec(self):
         """Are all of the fields fully specified?"""
-        return all([getattr(self,f) is not None for f in self._fields])
+        return all(getattr(self,f) is not None for f in self._fields)
     
     
     @property
@@ -128,24 +187,21 @@ class BaseFile:
         if not self.is_spec:
             raise ValueError('Underspecified file has no path.')
         if self._path is None:
-            self._path = self.determine(*[getattr(self,f) for f in self._fields])
-        return self._path[:]
-    
-    
+            self._path = self.determine(*(getattr(self,f) for f in self._fields))
+        return self._path
+
+
     @property
     def filename(self):
         """Return the filename.
         Returns None if it is not a valid file or has not been determined."""
-        if self.is_local:
-            return self.path.split(os.sep)[-1]
-        else:
-            return self.path.split('/')[-1]
-    
-    
+        return self._derived[1]
+
+
     @property
     def extension(self):
         """Return the file extension."""
-        return self.path.split('.')[-1].lower()
+        return self._derived[2]
     
     
     @property
@@ -176,15 +232,15 @@ class BaseFile:
     
     @property
     def folder(self):
-        """Return the filename."""
+        """Return the containing folder."""
         if self._path is not None:
-            return os.path.split(self._path)[0]
+            return self._derived[3]
     
     
     @property
     def fields(self):
         """What elements are needed to fully specify a file."""
-        return [f[:] for f in self._fields]
+        return tuple(self._fields)
     
     
     def grab(self, top_dir=None, exact_dir=None, replace=False,
@@ -269,31 +325,46 @@ class BaseFile:
             return how([self._match(o) for o in other])
     
     
+    @property
+    def _key(self):
+        """Tuple of the field values, cached so that repeated equality
+        tests and set/dict operations compare one tuple instead of
+        calling getattr per field."""
+        k = self._key_cache
+        if k is None:
+            k = tuple(getattr(self,f) for f in self._fields)
+            self._key_cache = k
+        return k
+
+
     def _match(self,other):
         """Match a single instance."""
         return type(other) is type(self) and all(
-            match(getattr(self,f),getattr(other,f)) for f in self._fields)
-    
-    
+            match(x,y) for x,y in zip(self._key, other._key))
+
+
     def __eq__(self,other):
-        eq = type(self) is type(other) and all(
-            [getattr(self,f)==getattr(other,f) for f in self._fields])
-        
-        if eq:  # Internals to a local file if possible
+        eq = type(self) is type(other) and self._key == other._key
+
+        if eq:  # Point internals to a local file if possible
             if self.is_local and not other.is_local:
-                other.__dict__ = self.__dict__
+                other._path, other._is_local = self._path, self._is_local
             elif other.is_local and not self.is_local:
-                self.__dict__ = other.__dict__
+                self._path, self._is_local = other._path, other._is_local
         return eq
-    
-    
+
+
     def __ne__(self,other):
         """Rely on user to define __eq__ for inheriting classes."""
         return not self==other
-    
-    
+
+
     def __hash__(self):
-        return hash((self._tile,self._date,self._product))
+        h = self._hash_cache
+        if h is None:
+            h = hash((self._tile,self._date,self._product))
+            self._hash_cache = h
+        return h
     
     
     def __repr__(self):
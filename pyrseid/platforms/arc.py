@@ -7,6 +7,7 @@
 # see "Data Source" on this above website.
 
 from datetime import datetime
+import os
 import zipfile
 import numpy as np
 
@@ -16,12 +17,13 @@ def shape():
 
 
 def isARCDateString(ds):
+    # Cheap prefilter: most non-date names fail here without paying for
+    # exception raising in the per-file listing loop.
+    if len(ds) != 8 or not ds.isdigit():
+        return False
     try:
-        y = int(ds[:4])
-        m = int(ds[4:6])
-        d = int(ds[6:])
-        return datetime(y,m,d)
-    except:
+        return datetime.strptime(ds, '%Y%m%d')
+    except ValueError:
         return False
 
 
@@ -44,7 +46,7 @@ def isFile(fpath):
     if sp[2] != "tif":
         return False
 
-    if len(sp) is 4:
+    if len(sp) == 4:
         if sp[-1] != "zip":
             return False
 
@@ -124,7 +126,7 @@ def filesInFolder(folder):
 def unzip(f):
     z = zipfile.ZipFile(f.fullpath())
     
-    if len(z.namelist()) is not 1:
+    if len(z.namelist()) != 1:
         z.close()
         raise ValueError("Expected that ARC2 zipfile contained 1 item.")
     else:
@@ -143,34 +145,73 @@ def unzip(f):
         return File(filename=fname,date=f.date(),localpath=localpath)
 
 
+def _read_geotiff(path):
+    """Read a geoTiff into a numpy array.
+    Uses tifffile (a thin numpy reader) when available and falls back
+    to the heavier gdal bindings otherwise.
+    """
+    try:
+        import tifffile
+    except ImportError:
+        pass
+    else:
+        return tifffile.imread(path)
+
+    import gdal
+    geotiff = gdal.Open(path)
+    if geotiff is None:
+        raise RuntimeError("Could not open unzipped geotiff file",path)
+    data = geotiff.GetRasterBand(1).ReadAsArray(
+        0, 0, geotiff.RasterXSize, geotiff.RasterYSize)
+    del(geotiff)
+    return data
+
+
 def read(f, missing=np.nan):
     """Read an African Rainfall Climatology File.
     The file can be in zipped or unzipped form.
     Input is an ARC File object. Output is a numpy array of data.
     """
-    import gdal
     if f.is_zipped():
         f = unzip(f) # Unzip and return a File
 
-    geotiff = gdal.Open(f.fullpath())
-    if geotiff is None:
-        raise RuntimeError("Could not open unzipped geotiff file",f)
+    data = _read_geotiff(f.fullpath())
 
-    band = geotiff.GetRasterBand(1)
-    data = band.ReadAsArray(0, 0, geotiff.RasterXSize, geotiff.RasterYSize)
+    # Mask the negative (invalid) pixels in one fused pass instead of a
+    # separate boolean-indexing assignment.
+    if isinstance(missing, float) and np.isnan(missing):
+        data = data.astype(np.float32, copy=False)
+    return np.where(data < 0, missing, data)
 
-    del(geotiff)
-    os.remove(f.fullpath())
 
-    data[data<0] = missing
+def cleanup(f):
+    """Remove the unzipped geoTiff for a File that also exists in
+    zipped form. read() no longer deletes it, so repeated reads of the
+    same date do not pay for a fresh zip extraction each time."""
+    if not f.is_zipped() and os.path.exists(f.fullpath()+'.zip'):
+        os.remove(f.fullpath())
 
-    return data
 
+_grid_cache = None
 
-def grid():
+
+def grid_axes():
+    """Return the 1d (lat, lon) axes of the ARC2 grid.
+    Cheaper than grid() when coordinates along one dimension suffice."""
     res = 0.1
     lo = np.arange(-20,55+res,res)
     la = np.arange(40,-40-res,-res)
-    ret = {}
-    ret['lat'],ret['lon'] = np.meshgrid(la,lo,indexing='ij')
-    return ret
+    return la, lo
+
+
+def grid():
+    global _grid_cache
+    if _grid_cache is None:
+        # The grid is fixed, so build the ~9 MB meshgrid once and hand
+        # out read-only views on subsequent calls.
+        la, lo = grid_axes()
+        lat, lon = np.meshgrid(la,lo,indexing='ij')
+        lat.flags.writeable = False
+        lon.flags.writeable = False
+        _grid_cache = {'lat': lat, 'lon': lon}
+    return dict(_grid_cache)
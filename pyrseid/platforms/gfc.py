@@ -1,4 +1,6 @@
 import os
+import sys
+import functools
 import numpy as np
 
 from ..utils import pretty_lat_print, pretty_lon_print, path_is_local
@@ -9,16 +11,40 @@ from ..file import BaseFile
 #from ..download import putfile
 
 
+# Per-pixel offsets within a 10°x10° tile are identical for every
+# tile, so build the unit axes once and let grid() just shift them.
+_TILE_RES = 10 * 60 * 60 # 1 arc-second for each pixel
+_STRIDE = 1 / _TILE_RES # One pixel in degrees
+_UNIT_LON = np.linspace(_STRIDE/2, 10-(_STRIDE/2), _TILE_RES)
+_UNIT_LAT = np.linspace(10-(_STRIDE/2), _STRIDE/2, _TILE_RES) # Reversed
+_UNIT_LON.setflags(write=False)
+_UNIT_LAT.setflags(write=False)
+
+
+_SIGN = {'S': -1, 'W': -1, 'N': 1, 'E': 1}
+
+
 class Tile(BaseTile):
     """Represents a 10°x10° GFC granule."""
-    
+
+    __slots__ = ('_bbox', '_str')
     _hrange = Range(0,35) # BaseTile needs this
     _vrange = Range(0,13)
     
     def __init__(self,v,h):
         """The granule to represent in (v,h) where (0,0) is the upper left granule"""
         super().__init__(v,h)
-    
+        # A Tile is immutable, so the BoundingBox (used by __repr__,
+        # __str__, grid and URL construction) is built once here.
+        self._bbox = BoundingBox(n=10*(8-v),s=10*(7-v),w=10*(h-18),e=10*(h-17))
+
+        # Interned so tile-keyed dicts and repeated URL construction
+        # share one string per tile and compare by identity.
+        bbox = self._bbox
+        lo = str(abs(int(bbox.w))).zfill(3) + ('W' if bbox.w<0 else 'E')
+        la = str(abs(int(bbox.n))).zfill(2) + ('S' if bbox.n<0 else 'N')
+        self._str = sys.intern(la+'_'+lo)
+
     
     def __repr__(self):
         """Format the print characteristics."""
@@ -32,48 +58,78 @@ class Tile(BaseTile):
     @staticmethod
     def that_contains(lat, lon):
         """Build a GFC Tile that contains a certain Point."""
-        raise NotImplementedError
+        # Tile corners fall on multiples of 10°, so the indices come
+        # straight from integer division (no tile sweep).
+        v = int(7 - lat // 10)
+        h = int(lon // 10) + 18
+        return Tile(v=v, h=h)
+
+
+    @classmethod
+    def tiles_in_bbox(cls, bbox):
+        """List the Tiles intersecting a BoundingBox.
+
+        The (v, h) index ranges are computed directly from the bbox
+        corners, so this is O(tiles returned) instead of sweeping the
+        full 36x14 tile grid. Tiles that only touch the bbox along
+        their southern or eastern edge are not included.
+        """
+        v_lo = max(int(8 - np.ceil(bbox.n / 10)), cls._vrange.lower)
+        v_hi = min(int(7 - bbox.s // 10), cls._vrange.upper)
+        h_lo = max(int(bbox.w // 10) + 18, cls._hrange.lower)
+        h_hi = min(int(np.ceil(bbox.e / 10)) + 17, cls._hrange.upper)
+        return [cls(v=v, h=h) for v in range(v_lo, v_hi+1)
+                              for h in range(h_lo, h_hi+1)]
     
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)  # Only ~500 tiles exist
     def from_str(s):
         """Build a gfc.Tile from it's corresponding string specification.
         Ex.: 40N_080W"""
-        
-        def negate_SW(s):
-            return -1 if s in ['S','W'] else 1
-        
         try:
-            la = negate_SW(s[2]) * int(s[:2])
-            lo = negate_SW(s[7]) * int(s[4:7])
-            v,h = int(8-(la/10)), int((lo/10)+18)
+            la = _SIGN[s[2]] * int(s[:2])
+            lo = _SIGN[s[7]] * int(s[4:7])
+            # Tile corners are multiples of 10, so integer division is
+            # exact and never round-trips through float.
+            v, h = 8 - la // 10, lo // 10 + 18
         except:
             raise ValueError('Ill-formed Tile specification string: "'+s+'"')
-        
+
         return Tile(h=h,v=v)
     
     
     def bbox(self):
         """Return the bounding coordinates for a tile."""
-        return BoundingBox(n=10*(8-self.v),s=10*(7-self.v),w=10*(self.h-18),e=10*(self.h-17))
+        return self._bbox
     
     
     def grid(self):
         """Return the lat/lon coordinates for each pixel."""
-        n = 10 * 60 * 60 # 1 arc-second for each pixel
-        stride = 1/n # One pixel in degrees
         bb = self.bbox()
-        lon = np.linspace(stride/2,10-(stride/2),n)
-        lat = np.linspace(10-(stride/2),stride/2,n) # Reversed
-        return {'lat':lat+bb.n,'lon':lon+bb.w}
+        return {'lat':_UNIT_LAT+bb.n,'lon':_UNIT_LON+bb.w}
+
+
+    def pixel_latlon(self, i, j):
+        """The (lat, lon) of pixel (i, j) as scalars.
+
+        Equivalent to (grid()['lat'][i], grid()['lon'][j]) but O(1):
+        callers that only need a few coordinates avoid materializing
+        the two 36000-element grid arrays.
+        """
+        bb = self.bbox()
+        return (bb.n + _UNIT_LAT[i], bb.w + _UNIT_LON[j])
     
     
     def __str__(self):
         """Generate a tile text specification."""
-        bbox = self.bbox()
-        lo = str(abs(int(bbox.w))).zfill(3) + ('W' if bbox.w<0 else 'E')
-        la = str(abs(int(bbox.n))).zfill(2) + ('S' if bbox.n<0 else 'N')
-        return la+'_'+lo
+        return self._str
+
+
+    def __hash__(self):
+        # Pack the two small indices into one int; cheaper than
+        # tuple-hashing and stable across runs.
+        return (self._v << 8) | self._h
 
 
 _valid_products_ = ['treecover2000','first','last','loss','gain','lossyear','datamask']
@@ -92,7 +148,9 @@ def list_products(path=None):
 
 """A GFC data product."""
 class Product(BaseProduct):
-    
+
+    __slots__ = ()
+
     def __init__(self,product,version=1.2):
         """Build a GFC data product.
         
@@ -111,6 +169,21 @@ class Product(BaseProduct):
                 super().__init__(name=product,version=version,platform="GFC")
 
                 
+_open_datasets_ = {} # Memoized open gdal datasets, keyed on path
+
+
+def _open_dataset(path):
+    """Return a (possibly cached) open gdal dataset for a path.
+    Opening is not free and read() is often called repeatedly on the
+    same tile, so keep datasets open for the life of the session."""
+    ds = _open_datasets_.get(path)
+    if ds is None:
+        import gdal
+        ds = gdal.Open(path)
+        _open_datasets_[path] = ds
+    return ds
+
+
 _url_prefix='https://storage.googleapis.com/earthenginepartners-hansen'
 _ver_str_ = {1.0:'GFC2013',1.2:'GFC2015'}
 _ver_num_ = {'GFC2013':1.0,'GFC2015':1.2}
@@ -121,40 +194,29 @@ _hansen_ = 'Hansen_'
 class File(BaseFile):
     
     # Must define 'fields' for types that inherit from BaseFile
+    __slots__ = ()
     _fields = ('product','tile')
     _is_deterministic = True # Override other BaseFile defaults
     _platform = 'GFC'
     
     def __init__(self,product,tile):
         """"""
-        # set product
-        try:
-            assert(type(product)==Product or product is None)
-            self._product = product
-        except AssertionError:
+        if product is not None and not isinstance(product, Product):
             raise TypeError('product must be a valid gfc.Product or None')
-        
-        # set tile
-        try:
-            assert(type(tile)==Tile or tile is None)
-            self._tile = tile
-        except AssertionError:
+        if tile is not None and not isinstance(tile, Tile):
             raise TypeError('tile must be a valid gfc.Tile or None')
-        
+
+        self._product = product
+        self._tile = tile
+
         super().__init__(is_valid=True)
     
     
     @staticmethod
-    def determine_file(product,tile):
-        """Determine the path to another File .
-        
-        Arguments:
-            d : [dict] - A dictionary whose keys are . Will raise
-            an error if fields are not implemented.
-        
-        """
-        fname = '_'.join([_hansen_+_ver_str_[product.version],product.name,str(tile)])+'.tif'
-        return '/'.join([_url_prefix,_ver_str_[product.version],fname])
+    def determine(product,tile):
+        """Determine the remote path to a File from its fields."""
+        ver = _ver_str_[product.version]
+        return f"{_url_prefix}/{ver}/{_hansen_}{ver}_{product.name}_{tile}.tif"
     
     
     def grab(self, directory, replace=False):
@@ -177,20 +239,37 @@ class File(BaseFile):
         return 'GCF.File('+str(self.product)+', '+str(self.tile)+')'
     
     
-    def read(self):
-        """Read 
-        TODO: Define a read object?"""
-        import gdal
+    def read(self, window=None):
+        """Read the data in this File as an array.
+
+        Arguments
+        ---------
+        window : [None] | BoundingBox
+            If given, only the pixels falling inside this lat/lon
+            BoundingBox are read from disk. A full tile is 36000x36000
+            uint8 (1.3 GB), so subset reads are far cheaper.
+        """
         if not self.is_local:
             raise RuntimeError("Can only read data from local (downloaded) Files.")
-        return gdal.Open(self.path).ReadAsArray()
+        ds = _open_dataset(self.path)
+        if window is None:
+            return ds.ReadAsArray()
+
+        bb = self.tile.bbox()
+        ppd = _TILE_RES / 10 # Pixels per degree
+        xoff = max(int((window.w - bb.w) * ppd), 0)
+        yoff = max(int((bb.n - window.n) * ppd), 0)
+        xend = min(int(np.ceil((window.e - bb.w) * ppd)), _TILE_RES)
+        yend = min(int(np.ceil((bb.n - window.s) * ppd)), _TILE_RES)
+        if xend <= xoff or yend <= yoff:
+            raise ValueError('Window does not intersect tile '+str(self.tile))
+        return ds.ReadAsArray(xoff, yoff, xend-xoff, yend-yoff)
     
     
     @staticmethod
     def from_path(path):
         """Build a File from a path name."""
         # Ex: Hansen_GFC2015_treecover2000_40N_080W.tif
-        f = File(None, None) # Build an invalid file
         try:
             split = os.path.split(path)[1].split('.')[0].split('_')
             tile = Tile.from_str('_'.join(split[3:5]))
@@ -198,32 +277,15 @@ class File(BaseFile):
             f = File(product,tile)
             f._path = path
             f._is_valid = True
-            
+
         except:
             f = File(None,None)
             f._path = path # invalid path
             f._is_valid = False
-        
-        f = File(prod, tile)
-        f._path = path
-        
-        if path_is_local(path):
-            f._is_local = True
-        else:
-            f._is_local = False
-        
+
+        f._is_local = path_is_local(path)
+
         return f
     
     def bbox(self):
         return self.tile
-
-
-def have_files():
-    for i in range(0):
-        pass
-    
-    
-def read(file):
-    import gdal
-    tif = gdal.Open(file.path).ReadAsArray()
-
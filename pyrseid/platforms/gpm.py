@@ -4,7 +4,9 @@ from ..file import BaseFile
 from ..base import Range
 
 import os
+import re
 import datetime
+import functools
 import numpy as np
 
 
@@ -22,7 +24,9 @@ def is_product_name(prod):
 
 class Product(BaseProduct):
     """A GPM data product."""
-    
+
+    __slots__ = ('_is_realtime', '_url_prefix')
+
     def __init__(self, prodstr):
         """Build a IMERG Product."""
         if not is_product_name(prodstr):
@@ -37,6 +41,12 @@ class Product(BaseProduct):
         version = 'V03E' if self.is_realtime else 'V03D'
         super().__init__(name=name, version=version, platform='GPM',
                          level=level, daterange=dr)
+
+        # The URL prefix depends only on the product, so bind it once
+        # here; determine() formats only the date-dependent tail.
+        self._url_prefix = (f"{_base_url_}{self.platform}_L{level[0]}/"
+                            f"{self.platform}_{self.algorithm}{self.shortname}"
+                            f".{level[0].zfill(2)}/")
     
     @property
     def is_realtime(self):
@@ -67,29 +77,43 @@ class Product(BaseProduct):
         return _short_names_[self.name]
 
 
-_mo_base_url_ = ('http://gpm1.gesdisc.eosdis.nasa.gov/data/s4pa//'
-                 '{}_L{}/{}_{}{}.{}/{}/{}')
-_hhr_base_url_ = ('http://gpm1.gesdisc.eosdis.nasa.gov/data/s4pa//'
-                  '{}_L{}/{}_{}{}.{}/{}/{}/{}')
+@functools.lru_cache(maxsize=8)
+def _product(prodstr):
+    """Memoized Product factory. Only a handful of product strings
+    exist, so folder scans share one Product per name instead of
+    re-parsing the string for every file."""
+    return Product(prodstr)
 
 
-_mo_base_url_ = ('http://gpm1.gesdisc.eosdis.nasa.gov/data/s4pa//'
-                 '{}_L{}/{}_{}{}.{}/{}/{}')
-_hhr_base_url_ = ('http://gpm1.gesdisc.eosdis.nasa.gov/data/s4pa//'
-                  '{}_L{}/{}_{}{}.{}/{}/{}/{}')
+_base_url_ = 'http://gpm1.gesdisc.eosdis.nasa.gov/data/s4pa//'
+
+
+# The 48 half-hour slots repeat identically every day, so the start/end
+# stamps and the sequence indicator are tabulated once at import;
+# determine() then avoids a timedelta and two strftime calls per file.
+_HHR_SLOTS = {}
+for _h in range(24):
+    for _m in (0, 30):
+        _end = _h * 60 + _m + 29
+        _HHR_SLOTS[(_h, _m)] = ('S{:02d}{:02d}00'.format(_h, _m),
+                                'E{:02d}{:02d}59'.format(_end//60, _end%60),
+                                '{:04d}'.format(_h * 60 + _m))
+del _h, _m, _end
 
 
 class File(BaseFile):
     """An GPM file."""
     
+    __slots__ = ()
     _fields = ('product', 'date')
     _is_deterministic = True  # We can deduce the filename from the requirments
     #_shape = (400, 1440)
-    
+
     def __init__ (self, product, date):
         """Create a GPM File from a product and date requirement."""
         File.validate(product, date)
         self._product, self._date = product, date
+        super().__init__()
     
     
     @staticmethod
@@ -98,48 +122,107 @@ class File(BaseFile):
         if product is None or date is None:
             raise ValueError('Cannot determine file when any fields are None.')
         
+        # One strftime call instead of a chain of zfill allocations
+        # per component.
+        day = date.strftime('%Y%m%d')
+
         if product.name.startswith('HHR'):
-            end_time = date + datetime.timedelta(minutes=29, seconds=59)
-            end = "E{}{}59".format(str(end_time.hour).zfill(2),
-                                   str(end_time.minute).zfill(2))
-            sequence_indicator = str((date.hour * 60) + date.minute).zfill(4)
-        
+            start, end, sequence_indicator = _HHR_SLOTS[(date.hour,
+                                                         date.minute)]
         elif product.name == 'MO':
+            start = date.strftime('S%H%M00')
             end = "E235959"
-            sequence_indicator = str(date.month).zfill(2)
-        
+            sequence_indicator = f"{date.month:02d}"
+
         else:
             raise NotImplementedError("Unknown GPM product.")
-        
-        day = "{}{}{}".format(str(date.year).zfill(4),
-                              str(date.month).zfill(2),
-                              str(date.day).zfill(2))
-        
-        start = "S{}{}00".format(str(date.hour).zfill(2),
-                                 str(date.minute).zfill(2))
-        
-        fname = "{}-{}.{}.{}.{}.{}-{}-{}.{}.{}.HDF5".format(
-            product.level, product.name, product.instrument,
-            product.satellite,product.algorithm, day, start,
-            end, sequence_indicator, product.version)
-        
-        
+
+        fname = (f"{product.level}-{product.name}.{product.instrument}."
+                 f"{product.satellite}.{product.algorithm}."
+                 f"{day}-{start}-{end}.{sequence_indicator}."
+                 f"{product.version}.HDF5")
+
         if product.name.startswith('HHR'):
             doy = date_to_doy(date)
-            return _hhr_base_url_.format(
-                product.platform, product.level[0], product.platform,
-                product.algorithm, product.shortname, product.level[0].zfill(2),
-                date.year, str(doy).zfill(3), fname)
+            return f"{product._url_prefix}{date.year}/{doy:03d}/{fname}"
 
         elif product.name == 'MO':
-            return _mo_base_url_.format(
-                product.platform, product.level[0], product.platform,
-                product.algorithm, product.shortname, product.level[0].zfill(2),
-                date.year, fname)
+            return f"{product._url_prefix}{date.year}/{fname}"
         else:
             raise NotImplementedError("Don't know how to guess remote path.")
     
     
+    @staticmethod
+    def determine_many(product, dates):
+        """Determine the remote paths for many dates at once.
+
+        Arguments
+        ---------
+        product : gpm.Product
+        dates : sequence convertible to numpy datetime64 (minute
+            precision or finer).
+
+        Returns
+        -------
+        A numpy array of URL strings, one per date, matching what
+        determine() would produce for each date individually.
+
+        Notes
+        -----
+        All datetime formatting and concatenation happens in vectorized
+        numpy string operations, so generating e.g. a year of
+        half-hourly URLs (48 x 365) skips the per-date Python datetime
+        and str machinery entirely.
+        """
+        if product is None:
+            raise ValueError('Cannot determine files without a product.')
+
+        dates = np.asarray(dates, dtype='datetime64[m]')
+        stamps = np.datetime_as_string(dates, unit='m')  # 'YYYY-MM-DDTHH:MM'
+        ch = stamps.view('U1').reshape(stamps.size, -1)
+
+        def pick(cols, width):
+            """Re-join a selection of character columns into strings."""
+            return ch[:, cols].copy().view('U{}'.format(width)).ravel()
+
+        def cat(first, *rest):
+            out = first
+            for part in rest:
+                out = np.char.add(out, part)
+            return out
+
+        yr = pick([0, 1, 2, 3], 4)
+        day = pick([0, 1, 2, 3, 5, 6, 8, 9], 8)     # YYYYMMDD
+        start = pick([11, 12, 14, 15], 4)           # HHMM
+
+        if product.name.startswith('HHR'):
+            minutes = (dates - dates.astype('datetime64[D]')).astype(int)
+            end_h = np.char.zfill(((minutes + 29) // 60).astype('U2'), 2)
+            end_m = np.char.zfill(((minutes + 29) % 60).astype('U2'), 2)
+            seq = np.char.zfill(minutes.astype('U4'), 4)
+            end = cat(end_h, end_m, '59')
+        elif product.name == 'MO':
+            end = '235959'
+            seq = pick([5, 6], 2)                   # Month
+        else:
+            raise NotImplementedError("Unknown GPM product.")
+
+        head = (f"{product.level}-{product.name}.{product.instrument}."
+                f"{product.satellite}.{product.algorithm}.")
+        fname = cat(head, day, '-S', start, '00-E', end, '.', seq,
+                    '.' + product.version + '.HDF5')
+
+        prefix = product._url_prefix
+
+        if product.name.startswith('HHR'):
+            days = dates.astype('datetime64[D]')
+            doy = (days - days.astype('datetime64[Y]').astype(
+                'datetime64[D]')).astype(int) + 1
+            doy = np.char.zfill(doy.astype('U3'), 3)
+            return cat(prefix, yr, '/', doy, '/', fname)
+        return cat(prefix, yr, '/', fname)
+
+
     @staticmethod
     def validate(product, date):
         """This function should raise an error if any fields are invalid."""
@@ -169,29 +252,30 @@ class File(BaseFile):
     @staticmethod
     def from_path(path, is_local=None):
         """Create a GPM File from an absolute path."""
-        assert is_local in {None, True, False}
-        
+        if is_local not in (None, True, False):
+            raise ValueError('is_local must be None, True or False.')
+
         if is_local is None:
             is_local = not path.startswith(('http://', 'ftp://'))
-        
+
         if is_local:
-            fname = path.split('/')[-1]
+            fname = os.path.basename(path)
         else:
-            fname = os.path.split(path)[-1]
-        
-        spl = fname.split('.')
-        assert len(spl) is 8
-        
-        prodstr = spl[0]
-        product = Product(prodstr)
-        day, start, end = spl[4].split('-')
+            fname = path.rpartition('/')[2]
+
+        # One pass of the compiled pattern instead of splitting the
+        # name three times and indexing into the pieces.
+        m = _fname_pattern_.match(fname)
+        if m is None:
+            raise ValueError('Not a recognized GPM filename: {}'.format(fname))
+
+        prodstr, day, start = m.group(1, 2, 3)
+        product = _product(prodstr)
         date = datetime.datetime(int(day[:4]), int(day[4:6]), int(day[6:]),
-                                 int(start[1:3]), int(start[3:5]))
-        
-        File.validate(product, date)
-        
-        f = File(product, date)
-        f._path = path[:]
+                                 int(start[:2]), int(start[2:4]))
+
+        f = File(product, date)  # Also validates
+        f._path = path
         f._is_valid = True
         f._is_local = is_local
         return f
@@ -209,14 +293,70 @@ class File(BaseFile):
         return hash((self._product, self._date))
 
 
+# The IMERG filename scheme. One regex match rejects non-GPM names
+# without the splits/exception that File.from_path pays per candidate.
+_fname_pattern_ = re.compile(
+    r'(3B-[A-Z-]+)\.MS\.MRG\.3IMERG\.'
+    r'(\d{8})-S(\d{6})-E\d{6}\.\d{2,4}\.V\d+[A-Z]?\.HDF5$')
+
+
+# Month lengths in a non-leap year, for the vectorized calendar check
+# in have_files.
+_days_per_month_ = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+_days_per_month_.setflags(write=False)
+
+
 def have_files(folder,recursive=False):
-    """List the valid TRMM files in a folder."""
-    all_files = os.listdir(folder)
+    """List the valid GPM files in a folder."""
+    # Collect the regex-validated candidates first; everything after
+    # this point runs without exceptions as control flow.
+    matches = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            m = _fname_pattern_.match(entry.name)
+            if m is not None and m.group(1) in _valid_products_:
+                matches.append((entry.name,) + m.group(1, 2, 3))
+
+    if not matches:
+        return []
+
+    # Validate every timestamp in one vectorized pass, mirroring the
+    # checks in File.validate, so File construction below cannot raise.
+    val = np.array([d + s for _, _, d, s in matches], dtype=np.int64)
+    sec = val % 100
+    minute = (val // 100) % 100
+    hour = (val // 10000) % 100
+    dom = (val // 10**6) % 100
+    month = (val // 10**8) % 100
+    is_mo = np.array([p == '3B-MO' for _, p, _, _ in matches])
+    hhr_ok = (minute % 30 == 0) & (sec == 0)
+    mo_ok = (dom == 1) & (hour == 0) & (minute == 0) & (sec == 0)
+    ok = np.where(is_mo, mo_ok, hhr_ok)
+    ok &= (month >= 1) & (month <= 12) & (dom >= 1)
+    ok &= (hour < 24) & (minute < 60)
+    # Calendar-valid day of month (month-length table plus the February
+    # leap correction), so a regex-valid name like ...20150230... is
+    # dropped here instead of raising out of datetime below.
+    year = val // 10**10
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    ok &= dom <= (_days_per_month_[np.clip(month, 1, 12) - 1]
+                  + ((month == 2) & leap))
+    # Start of the period of record, taken from the shared Product
+    # daterange rather than repeating the constant here.
+    por = _product('3B-HHR').daterange.lower
+    ok &= val >= (por.year * 10**10 + por.month * 10**8 + por.day * 10**6
+                  + por.hour * 10**4 + por.minute * 100 + por.second)
+
     gpm_files = []
-    for f in all_files:
-        try:
-            tf = File.from_path(os.path.join(folder,f))
-            gpm_files.append(tf)
-        except:
-            pass
+    for keep, (name, prodstr, day, start) in zip(ok, matches):
+        if not keep:
+            continue
+        product = _product(prodstr)
+        date = datetime.datetime(int(day[:4]), int(day[4:6]), int(day[6:]),
+                                 int(start[:2]), int(start[2:4]))
+        f = File(product, date)
+        f._path = os.path.join(folder, name)
+        f._is_valid = True
+        f._is_local = True
+        gpm_files.append(f)
     return gpm_files
\ No newline at end of file
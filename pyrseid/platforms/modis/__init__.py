@@ -4,37 +4,81 @@ import datetime
 import os
 import urllib
 import textwrap
-import re
 import math
+import time
+import functools
+import importlib
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
-from ...read import read_hdf
+from ...read import read_hdf, read_many_hdf
 from ...utils import doy_to_datetime, date_to_psv, list_links, ensure_dir_exists
 
-from .file import Tile, Product, File, get_product_folder
+from .file import (Tile, Product, File, HVPair, get_product_folder,
+                   _fname_pattern_)
 
-from .ladsweb import available_dates as ladsweb_available_dates
-from .lpdaac import available_dates as lpdaac_available_dates
-from .ladsweb import available_files as ladsweb_available_files
-from .lpdaac import available_files as lpdaac_available_files
+
+@functools.lru_cache(maxsize=None)
+def _server(name):
+    """Import and memoize a server submodule. Deferring the import
+    means a session that never lists remote files never executes the
+    server modules, and repeat calls skip the name lookup."""
+    if name not in ('lpdaac', 'ladsweb'):
+        raise ValueError('Unknown MODIS server: {}'.format(name))
+    return importlib.import_module(__name__ + '.' + name)
+
+
+# Remote listings rarely change within a session, but available_dates/
+# available_files pay a server round-trip per call (and grab_all calls
+# them repeatedly). Cache results in memory for an hour.
+_listing_cache_ = {} # key -> (timestamp, result)
+_listing_ttl_ = 3600. # Seconds before a remote listing is re-fetched
+
+
+def _freeze(x):
+    """A hashable stand-in for a dates/tiles argument, for cache keys."""
+    if x is None:
+        return None
+    try:
+        return tuple(sorted(x))
+    except TypeError:
+        pass
+    try:
+        return (x.lower, x.upper) # A Range
+    except AttributeError:
+        return repr(x)
+
+
+def _cached_listing(key, fetch):
+    """Return a possibly-cached remote listing, re-fetching once the
+    TTL expires. A copy is returned so callers cannot mutate the
+    cached value."""
+    hit = _listing_cache_.get(key)
+    now = time.time()
+    if hit is None or now - hit[0] >= _listing_ttl_:
+        hit = (now, fetch())
+        _listing_cache_[key] = hit
+    return hit[1].copy()
 
 
 def available_dates(prod, dates=None, server="lpdaac"):
-    if server == 'lpdaac':
-        #import geospatial.platforms.modis.lpdaac as lpdaac
-        return lpdaac_available_dates(prod, dates=dates)
-    elif server == 'ladsweb':
-        #import geospatial.platforms.modis.ladsweb as ladsweb
-        return ladsweb_available_dates(prod, dates=dates)
+    key = ('dates', server, prod, _freeze(dates))
+    srv = _server(server)
+    return _cached_listing(
+        key, lambda: srv.available_dates(prod, dates=dates))
 
 
 def available_files(prod, dates=None, tiles=None, exact_dates=False,
                     server="lpdaac"):
-    if server == 'lpdaac':
-        return lpdaac_available_files(prod, dates=dates, tiles=tiles,
-                                      exact_dates=exact_dates)
-    elif server == 'ladsweb':
-        return ladsweb_available_files(prod, dates=dates, tiles=tiles)
+    key = ('files', server, prod, _freeze(dates), _freeze(tiles),
+           exact_dates)
+    srv = _server(server)
+    if server == 'lpdaac': # Only the lpdaac server takes exact_dates
+        fetch = lambda: srv.available_files(prod, dates=dates, tiles=tiles,
+                                            exact_dates=exact_dates)
+    else:
+        fetch = lambda: srv.available_files(prod, dates=dates, tiles=tiles)
+    return _cached_listing(key, fetch)
 
 
 def have_product_folder(modfolder, product):
@@ -47,22 +91,143 @@ def have_date_folders(modfolder, prod, dates=None):
     df = dict()
     if not os.path.isdir(pf):
         return df
-    poss_df = os.listdir(pf)
-    for pdf in poss_df:
-        try:
-            sp = pdf.split('.')
-            assert len(sp) is 3
-            y,m,d = int(sp[0]), int(sp[1]), int(sp[2])
-            
-            date = datetime.datetime(y, m, d)
+    # scandir hands back DirEntry objects whose is_dir() uses the data
+    # already fetched from the directory read -- no stat() per entry.
+    with os.scandir(pf) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            # Cheap shape checks reject non-date folders before any
+            # int conversion; only genuinely malformed dates (e.g.
+            # 2015.02.30) reach the ValueError below.
+            name = entry.name
+            if len(name) != 10 or name[4] != '.' or name[7] != '.':
+                continue
+            if not (name[:4].isdigit() and name[5:7].isdigit()
+                    and name[8:].isdigit()):
+                continue
+            try:
+                date = datetime.datetime(int(name[:4]), int(name[5:7]),
+                                         int(name[8:]))
+            except ValueError:
+                continue
             if dates is not None and date not in dates:
                 continue
-            df[date] = os.path.join(pf, pdf)
-        except:
-            pass
+            df[date] = entry.path
     return df
 
 
+# The MODIS filename grammar lives in file.py next to File.from_path;
+# one regex match classifies a directory entry without constructing a
+# File (or raising) for the names that don't belong.
+_FNAME_RE = _fname_pattern_
+
+
+def _scan_library(modfolder, prod, dates=None, tiles=None):
+    """Yield (date, h, v, path) for the matching local files of a
+    product. Shared by have_files and have_file_table."""
+    if not os.path.isdir(get_product_folder(modfolder, prod)):
+        return
+
+    # Frozensets give O(1) membership tests below; Ranges and
+    # TileRanges are left alone since their __contains__ is already
+    # O(1) bound comparison.
+    if isinstance(dates, (list, tuple, set)):
+        dates = frozenset(dates)
+    if isinstance(tiles, (list, tuple, set)):
+        tiles = frozenset(tiles)
+
+    date_folders = have_date_folders(modfolder, prod, dates=dates)
+    name_prefix = prod.name + '.'
+    # Walking the folders in date order means the yielded rows come out
+    # already sorted (files in one folder share a date), so consumers
+    # skip a full N log N sort over the library.
+    for d in sorted(date_folders):
+        df = date_folders[d]
+        with os.scandir(df) as entries:
+            for entry in entries:
+                # Two cheap str checks weed out .xml sidecars, partial
+                # downloads and other products before paying the regex.
+                fname = entry.name
+                if not (fname.startswith(name_prefix) and
+                        fname.endswith('.hdf')):
+                    continue
+                m = _FNAME_RE.match(fname)
+                if m is None:
+                    continue
+                name, yr, doy, h, v, version = m.groups()
+                if name != prod.name or version != prod.version:
+                    continue
+                date = doy_to_datetime(int(yr), int(doy))
+                if dates is not None and date not in dates:
+                    continue
+                h, v = int(h), int(v)
+                if tiles is not None and Tile(h=h, v=v) not in tiles:
+                    continue
+                yield date, h, v, entry.path
+
+
+class FileTable:
+    """Column-oriented view of a set of local MODIS files.
+
+    Holds one Product reference plus numpy columns for the dates, tile
+    indices and paths, sorted by date. A list of 10^4 File objects
+    costs megabytes of per-object overhead and pointer chasing; the
+    columns put the same metadata in a few contiguous arrays. Indexing
+    with an int synthesizes a File on demand; indexing with a boolean
+    mask or index array returns a sub-table, so date/tile filtering is
+    vectorized.
+    """
+
+    __slots__ = ('product', 'dates', 'hs', 'vs', 'paths')
+
+    def __init__(self, product, dates, hs, vs, paths):
+        order = np.argsort(dates, kind='stable')
+        self.product = product
+        self.dates = dates[order]
+        self.hs = hs[order]
+        self.vs = vs[order]
+        self.paths = paths[order]
+
+    def __len__(self):
+        return self.dates.size
+
+    def _make(self, i):
+        """Synthesize the File at row i."""
+        f = File(self.product, self.dates[i].astype(datetime.datetime),
+                 Tile(h=int(self.hs[i]), v=int(self.vs[i])))
+        f._path = self.paths[i]
+        f._is_valid = True
+        f._is_local = True
+        return f
+
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            return self._make(range(len(self))[i])
+        return FileTable(self.product, self.dates[i], self.hs[i],
+                         self.vs[i], self.paths[i])
+
+    def __iter__(self):
+        return (self._make(i) for i in range(len(self)))
+
+    def __repr__(self):
+        return 'FileTable({}, {} files)'.format(self.product, len(self))
+
+
+def have_file_table(modfolder, prod, dates=None, tiles=None):
+    """Like have_files, but returns a FileTable instead of a list of
+    File objects. Preferred for large libraries."""
+    rows = list(_scan_library(modfolder, prod, dates=dates, tiles=tiles))
+    n = len(rows)
+    dcol = np.empty(n, dtype='datetime64[s]')
+    hs = np.empty(n, dtype=np.uint8)
+    vs = np.empty(n, dtype=np.uint8)
+    paths = np.empty(n, dtype=object)
+    for i, (d, h, v, p) in enumerate(rows):
+        dcol[i], hs[i], vs[i], paths[i] = d, h, v, p
+    return FileTable(prod, dcol, hs, vs, paths)
+
+
 def have_files(modfolder, prod, dates=None, tiles=None):
     """List the MODIS files that product, date and tile specification.
     Arguments:
@@ -90,61 +255,57 @@ def have_files(modfolder, prod, dates=None, tiles=None):
             and tiles match input arguments.
     """
     files = []
-    
-    if not os.path.isdir(get_product_folder(modfolder, prod)):
-        return []
-    
-    date_folders = have_date_folders(modfolder, prod, dates=dates)
-    for d, df in date_folders.items():
-        poss_file_paths = os.listdir(df)
-        
-        for pf in poss_file_paths:
-            try:
-                if pf == ".modlist":
-                    continue
-                
-                path = os.path.join(df, pf)
-                #print(path)
-                f = File.from_path(path)
+    for date, h, v, path in _scan_library(modfolder, prod, dates=dates,
+                                          tiles=tiles):
+        f = File(prod, date, Tile(h=h, v=v)) # Reuse the queried Product
+        f._path = path
+        f._is_valid = True
+        f._is_local = True
+        files.append(f)
+
+    # _scan_library yields in date order already.
+    return files
 
-                if dates is not None and f.date not in dates:
-                    continue
 
-                if tiles is not None and f.tile not in tiles:
-                    continue
-                files.append(f)
-            except:
-                pass
-            
-    files.sort(key=lambda x: x.date)
-    return files
+def _download_workers():
+    """Thread count for parallel downloads. Downloads are latency
+    bound, not CPU bound, so the default sits well above the core
+    count; override with the PYRSEID_DL_CONCURRENCY environment
+    variable."""
+    try:
+        return max(1, int(os.environ['PYRSEID_DL_CONCURRENCY']))
+    except (KeyError, ValueError):
+        return min(32, (os.cpu_count() or 1) * 4)
 
 
-def date_to_psv(date):
-    return "{}.{}.{}".format(str(date.year).zfill(4),
-                             str(date.month).zfill(2), 
-                             str(date.day).zfill(2))
+def _grab_parallel(files, date_folders, replace):
+    """Download files concurrently into their date folders."""
+    if not files:
+        return
+    workers = min(_download_workers(), len(files))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(
+            lambda f: f.grab(date_folders[f.date], replace=replace), files))
 
 
 def grab_files(files, modfolder, replace=False):
     """Download a list of files into a MODIS library."""
-    
+
     # These files must all have the same product (they can have diff dates)
     assert all(f.product == files[0].product for f in files)
-    
+
     # Make sure all of the date folders exist or create them
     product_folder = get_product_folder(modfolder, files[0].product)
     unique_dates = set(f.date for f in files)
     date_folders = {d: os.path.join(product_folder, date_to_psv(d))
                     for d in unique_dates}
-    
+
     for d, df in date_folders.items():
         ensure_dir_exists(df)
-    
-    # Loop through these files and put them in 
-    for f in files:
-        f.grab(date_folders[f.date], replace=replace)
-    
+
+    # Downloads are dominated by network latency; fetch in parallel.
+    _grab_parallel(files, date_folders, replace)
+
     return files
 
 
@@ -159,40 +320,100 @@ def grab_all(modfolder, product, dates=None, tiles=None, replace=False):
     
     for d, df in date_folders.items():
         ensure_dir_exists(df)
-    
-    # Loop through these files and put them in 
-    for f in af:
-        f.grab(date_folders[f.date], replace=replace)
+
+    # Downloads are dominated by network latency; fetch in parallel.
+    _grab_parallel(af, date_folders, replace)
     return af
 
 
 def locate(lat,lon, resolution=None):
-    '''Get the MODIS Tile and pixel of a geographic coordinate.'''
-    if abs(lat) > 90:
+    '''Get the MODIS Tile and pixel of a geographic coordinate.
+
+    lat and lon may be scalars or broadcastable numpy arrays. For
+    scalar input the first return value is a modis.Tile; for array
+    input it is an HVPair of integer index arrays (building one Tile
+    object per coordinate would dominate the runtime).
+    '''
+    if np.isscalar(lat) and np.isscalar(lon):
+        # Pure-Python fast path: scalar math avoids the ndarray
+        # round-trip, and min() clamps without a branch mispredict.
+        if abs(lat) > 90:
+            raise Exception("Latitude out of bounds")
+        if abs(lon) > 180:
+            raise Exception("Longitude out of bounds")
+        yn1to1 = -lat/90
+        hfrac = (((lon/180)*math.cos(yn1to1*(math.pi/2))+1)/2)*36
+        vfrac = ((yn1to1+1)/2)*18
+        h = min(math.floor(hfrac), 35)
+        v = min(math.floor(vfrac), 17)
+        return Tile(h=h,v=v), (vfrac-v, hfrac-h)
+
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    if np.any(np.abs(lat) > 90):
         raise Exception("Latitude out of bounds")
-    elif abs(lon) > 180 :
+    if np.any(np.abs(lon) > 180):
         raise Exception("Longitude out of bounds")
 
     yn1to1 = -lat/90
-    xn1to1 = lon/180
-    
-    xn1to1_adj = xn1to1 * math.cos(yn1to1*math.pi/2)
-    
+    xn1to1_adj = (lon/180) * np.cos(yn1to1*(np.pi/2))
+
     # Find the bounding tile
     hfrac = ((xn1to1_adj+1)/2)*36
-    h = math.floor(hfrac)
-    if h == 36:
-        h = 35
-
     vfrac = ((yn1to1+1)/2)*18
-    v = math.floor(vfrac)
-    if v == 18:
-        v = 17
-    
-    tile = Tile(h=h,v=v)
-    
+    vfrac, hfrac = np.broadcast_arrays(vfrac, hfrac)
+    h = np.minimum(np.floor(hfrac), 35).astype(np.intp)
+    v = np.minimum(np.floor(vfrac), 17).astype(np.intp)
+
+    if hfrac.ndim == 0:
+        # Scalar input: keep returning a Tile, as before.
+        return Tile(h=int(h),v=int(v)), (float(vfrac-v), float(hfrac-h))
+
     # Now compute the fractional component:
-    return tile,(vfrac-v,hfrac-h)
+    return HVPair(h, v), (vfrac-v, hfrac-h)
+
+
+# The latitude column depends only on (v, resolution), the x row only
+# on (h, resolution), and the sinusoidal denominator only on the
+# latitude column -- so each is computed once per tile row/column and
+# reused across the grid (and assemble) calls that sweep many tiles.
+
+@functools.lru_cache(maxsize=8)
+def _unit_axis(resolution):
+    """Pixel-center fractions in [0, 1) for one tile axis.
+
+    Both the latitude column and the x row are affine transforms of
+    this same array, so one linspace per resolution serves every tile.
+    """
+    start, end = 1/(resolution*2), 1-(1/(resolution*2))
+    axis = np.linspace(start, end, resolution)
+    axis.setflags(write=False)
+    return axis
+
+
+@functools.lru_cache(maxsize=128)
+def _lat_col(v, resolution):
+    """Pixel-center latitudes for tile row v as a (resolution, 1) column."""
+    lats = ((18 - v - _unit_axis(resolution)) * 10 - 90)[...,None]
+    lats.setflags(write=False)
+    return lats
+
+
+@functools.lru_cache(maxsize=128)
+def _inv_sin_col(v, resolution):
+    """Reciprocal of the sinusoidal denominator for tile row v, so
+    grid() multiplies instead of dividing per pixel."""
+    inv = 1. / np.sin(np.pi*-(_lat_col(v, resolution)-90)/180)
+    inv.setflags(write=False)
+    return inv
+
+
+@functools.lru_cache(maxsize=128)
+def _x_row(h, resolution):
+    """Normalized x coordinates for tile column h as a (1, resolution) row."""
+    x = (((h + _unit_axis(resolution)) / 18.) - 1)[None,...]
+    x.setflags(write=False)
+    return x
 
 
 def grid(tile, resolution):
@@ -202,18 +423,16 @@ def grid(tile, resolution):
         tile - modis.Tile object
         resolution - 1200 | 2400 | 4800
             Corresponding to 1 km, 500 m or 250 m nominal pixel size.
-    
+
     Returns
         A dict with two fields: 'lat' and 'lon'. Each are numpy.ndarrays
-        with [resolution x resolution] dimensions.
+        with [resolution x resolution] dimensions. 'lat' is a read-only
+        broadcast view (every column is identical); call .copy() on it
+        if you need a writable array.
     """
-    start, end = 1/(resolution*2), 1-(1/(resolution*2))
-    lat_start = ((18 - tile.v - start) * 10) - 90
-    lat_end = ((18 - tile.v - end) * 10) - 90
-    lats = np.linspace(lat_start, lat_end, resolution)[...,None]
-    x = ((np.linspace(tile.h + start, tile.h + end, resolution) / 18.) - 1)[None,...]
-    lons = 180. * x / np.sin(np.pi*-(lats-90)/180)
-    lats = np.tile(lats,resolution)
+    lats = _lat_col(tile.v, resolution)
+    lons = (180. * _x_row(tile.h, resolution)) * _inv_sin_col(tile.v, resolution)
+    lats = np.broadcast_to(lats, (resolution, resolution))
     return {'lat': lats, 'lon': lons}
 
 
@@ -222,6 +441,15 @@ def offset(tile, resolution):
     return tile.v * resolution, tile.h * resolution
 
 
+@functools.lru_cache(maxsize=None)
+def _res_const(resolution):
+    """Per-resolution grid constants. Only a few resolutions ever
+    occur (1200/2400/4800), so compute each set of divisions once."""
+    return {'lat_pp': 180 / (18 * resolution),
+            'lon_pp': 360 / (36 * resolution),
+            'y_rad_pp': math.pi / (18 * resolution)}
+
+
 def latitude(y_pix, resolution, tile=None):
     """Find the latitude of MODIS pixels.
     
@@ -246,10 +474,12 @@ def latitude(y_pix, resolution, tile=None):
     if tile is not None:
         y_off, x_off = offset(tile, resolution)
         y_pix = y_pix + y_off
-    lat_per_pixel = 180 / (18 * resolution) # Degrees lat in each vertical pixel
+    lat_per_pixel = _res_const(resolution)['lat_pp'] # Degrees lat per vertical pixel
     lat = (y_pix * -lat_per_pixel) + (90 - (lat_per_pixel / 2))
-    lat[lat>90] = np.nan
-    lat[lat<-90] = np.nan
+    # Peeking at the extremes first means in-range inputs (the common
+    # case) never allocate a full-size boolean mask.
+    if lat.size and (lat.max() > 90 or lat.min() < -90):
+        np.putmask(lat, np.abs(lat) > 90, np.nan)
     return lat
 
 
@@ -283,24 +513,56 @@ def longitude(y_pix, x_pix, resolution, tile=None):
     if tile is not None:
         y_off, x_off = offset(tile, resolution)
         y_pix, x_pix = y_pix + y_off, x_pix + x_off
-    
-    y_radians_per_pixel = np.pi / (18 * resolution) # Degrees lat in each vertical pixel
-    
-    # Radians from 0 @ North Pole to PI @ South Pole
-    y_rad = (y_pix * y_radians_per_pixel) + (y_radians_per_pixel / 2)
-    
-    lon_per_pixel = 360 / (36 * resolution)
-    lon = (x_pix * lon_per_pixel) + (-180 + (lon_per_pixel / 2))
-    lon /= np.sin(y_rad)
-    lon[lon>180] = np.nan
-    lon[lon<-180] = np.nan
+
+    c = _res_const(resolution)
+    y_radians_per_pixel = c['y_rad_pp'] # Radians lat in each vertical pixel
+
+    # Radians from 0 @ North Pole to PI @ South Pole. Updated in place
+    # (including the sin) so no extra full-size temporaries are made.
+    y_rad = y_pix * y_radians_per_pixel
+    y_rad += y_radians_per_pixel / 2
+    np.sin(y_rad, out=y_rad)
+
+    lon_per_pixel = c['lon_pp']
+    lon = x_pix * lon_per_pixel
+    lon += -180 + (lon_per_pixel / 2)
+    lon /= y_rad
+    # One fused mask and assignment instead of two of each.
+    np.putmask(lon, np.abs(lon) > 180, np.nan)
     return lon
     
 
 def latlon(y_pix, x_pix, resolution, tile=None):
-    lat = latitude(y_pix, resolution, tile)
-    return {'lat':lat,
-            'lon':longitude(y_pix, x_pix, resolution=resolution, tile=tile)}
+    """Latitude and longitude of MODIS pixels in one fused pass.
+
+    Equivalent to calling latitude() and longitude() separately, but
+    the tile offset and the vertical angle are computed once and the
+    intermediates are updated in place, so large pixel arrays make
+    roughly half the trips through memory.
+    """
+    if tile is not None:
+        y_off, x_off = offset(tile, resolution)
+        y_pix, x_pix = y_pix + y_off, x_pix + x_off
+
+    lat_per_pixel = _res_const(resolution)['lat_pp']
+    lat = y_pix * -lat_per_pixel
+    lat += 90 - (lat_per_pixel / 2)
+
+    # The vertical angle (0 @ North Pole to pi @ South Pole) is just
+    # the unclamped latitude re-scaled, so derive it instead of
+    # recomputing it from y_pix.
+    sin_y = (90 - lat) * (np.pi / 180)
+    np.sin(sin_y, out=sin_y)
+
+    lon_per_pixel = 360 / (36 * resolution)
+    lon = x_pix * lon_per_pixel
+    lon += -180 + (lon_per_pixel / 2)
+    lon /= sin_y
+
+    if lat.size and (lat.max() > 90 or lat.min() < -90):
+        np.putmask(lat, np.abs(lat) > 90, np.nan)
+    np.putmask(lon, np.abs(lon) > 180, np.nan)
+    return {'lat':lat, 'lon':lon}
 
 
 def read(f, field, fillfunc=None, fillval=np.nan, astype=None, correction_factor=None):
@@ -310,9 +572,11 @@ def read(f, field, fillfunc=None, fillval=np.nan, astype=None, correction_factor
     PARAMETERS:
         f - modis.File
         
-        field_num - The position of the subdataset in the 
-            The number of the SubDataSet to read in.
-        
+        field_num - The position of the subdataset in the
+            The number of the SubDataSet to read in. May also be a
+            list/tuple of sub-dataset names, in which case the file is
+            opened once and a dict {field: ndarray} is returned.
+
         fill - [None] | dict
             If fill is specified, it should be a dict with of the form:
                 
@@ -348,21 +612,39 @@ def read(f, field, fillfunc=None, fillval=np.nan, astype=None, correction_factor
     """
     if type(f) is File:
         f = f.path
-    
-    data = read_hdf(f, field)
-    
+
+    if isinstance(field, (list, tuple)):
+        # One open of the HDF covers every requested sub-dataset
+        # instead of a full open/attribute-walk/close per field.
+        raw = read_many_hdf(f, field)
+        return {name: _convert(data, fillfunc, fillval, astype,
+                               correction_factor)
+                for name, data in raw.items()}
+
+    return _convert(read_hdf(f, field), fillfunc, fillval, astype,
+                    correction_factor)
+
+
+def _convert(data, fillfunc, fillval, astype, correction_factor):
+    """Apply the fill/convert/scale steps documented in read().
+
+    data is always freshly read from the file, so every step may work
+    in place: astype skips the copy when the dtype already matches,
+    the scale factor is applied with an out= ufunc, and the fill is a
+    single masked copyto rather than a fancy-indexed assignment.
+    """
     if fillfunc is not None:           #[1]
         to_fill = fillfunc(data)
-    
+
     if astype is not None:
-        data = data.astype(astype)     #[2]
-    
+        data = data.astype(astype, copy=False) #[2]
+
     if correction_factor is not None:
-        data *= correction_factor
-    
+        np.multiply(data, correction_factor, out=data)
+
     if fillfunc is not None:           #[3]
-        data[to_fill] = fillval
-    
+        np.copyto(data, fillval, where=to_fill)
+
     return data
 
 
@@ -445,27 +727,29 @@ def assemble(u, d, func=None, fill=np.nan, dtype=float, depth=1):
     ymin, ymax = min(y), max(y)
     xmin, xmax = min(x), max(x)
 
-    Y, X = u[0]*(ymax + 1 - ymin), u[1]*(xmax + 1 - xmin)
-
-    if depth is 1:
-        assembled = np.zeros(shape=[Y, X], dtype=dtype)
+    if depth == 1:
+        unit_shape = [u[0], u[1]]
     else:
-        assembled = np.zeros(shape=make_list(depth) + [Y, X], dtype=dtype)
-    
-    assembled[:] = fill
-    
+        unit_shape = make_list(depth) + [u[0], u[1]]
+
+    # All missing cells share this one fill block; np.block never
+    # writes through its inputs, so no per-cell allocation is needed.
+    fill_tile = np.full(unit_shape, fill, dtype=dtype)
+
+    rows = []
     for iy in range(ymin, ymax+1):
+        row = []
         for ix in range(xmin, xmax+1):
-            _y_, _x_ = iy-ymin, ix-xmin
             if (iy, ix) in d:
-                if func is None:
-                    assembled[...,
-                              u[0]*_y_:u[0]*(_y_+1),
-                              u[1]*_x_:u[1]*(_x_+1)] = d[(iy, ix)]
-                else:
-                    assembled[...,
-                              u[0]*_y_:u[0]*(_y_+1),
-                              u[1]*_x_:u[1]*(_x_+1)] = func(d[(iy, ix)])
-    return assembled
+                cell = d[(iy, ix)] if func is None else func(d[(iy, ix)])
+                row.append(np.asarray(cell, dtype=dtype))
+            else:
+                row.append(fill_tile)
+        rows.append(row)
+
+    # One bulk assembly: np.block allocates the output once and copies
+    # each tile as a contiguous slab instead of a Python-level fancy
+    # assignment per tile.
+    return np.block(rows)
 
 
@@ -1,4 +1,6 @@
 import os
+import re
+import functools
 import numpy as np
 
 from ...base import Range
@@ -17,9 +19,8 @@ def list_valid_products():
     sats = {"MOTA": "MCD", "MOLT": "MOD", "MOLA": "MYD"}
     
     for s in sats:
-        links = list_links('/'.join([base_url, s]))
-        valid_products.extend(
-            [l.strip('/') for l in links if l.startswith(sats[s])])
+        links = list_links('/'.join([base_url, s]), prefix=sats[s])
+        valid_products.extend(l.strip('/') for l in links)
     return valid_products
 
 
@@ -27,9 +28,11 @@ _this_dir_ = os.path.dirname(__file__)
 # _this_dir_ = %pwd #  For jupyter
 # Run this code once when the package is imported
 
-_prod_file = open(os.path.join(_this_dir_, 'modis_products.txt'))
-_prod_list = [i for i in _prod_file.read().split('\n') if len(i)]
-_prod_file.close()
+with open(os.path.join(_this_dir_, 'modis_products.txt')) as _prod_file:
+    # frozenset: is_valid_product runs per parsed filename, so
+    # membership should be O(1) rather than a list scan.
+    _prod_list = frozenset(
+        i for i in _prod_file.read().split('\n') if len(i))
 
 
 # def update_products_list():
@@ -66,7 +69,9 @@ _satellites_ = {"MCD": "MOTA", "MYD": "MOLA", "MOD": "MOLT"}
 
 class Product(BaseProduct):
     """A MODIS product and version."""
-    
+
+    __slots__ = ()
+
     def __init__(self, prodstr):
         if not is_valid_product(prodstr):
             raise Exception("Invalid MODIS Product name:", prodstr)
@@ -91,6 +96,14 @@ class Product(BaseProduct):
         return self.name[:3]
 
 
+@functools.lru_cache(maxsize=64)
+def _product(prodstr):
+    """Memoized Product factory. A library scan sees the same few
+    product strings thousands of times, so parsing and validating each
+    one happens once."""
+    return Product(prodstr)
+
+
 def get_product_folder(modfolder, product):
     return os.path.join(modfolder, '.'.join([product.name, product.version]))
 
@@ -98,7 +111,16 @@ def get_product_folder(modfolder, product):
 HVPair = namedtuple('HVPair', ['h', 'v'], )
 
 
+# Only 36x18 legal tiles exist, so the text forms are tabulated once
+# at import; __str__ (called in repr/logging paths during listing
+# merges) and from_str become single dict lookups.
+_tile_strs_ = {(h, v): 'h{:02d}v{:02d}'.format(h, v)
+               for h in range(36) for v in range(18)}
+_str_tiles_ = {s: hv for hv, s in _tile_strs_.items()}
+
+
 class Tile(BaseTile):
+    __slots__ = ()
     _hrange = Range(0, 35)
     _vrange = Range(0, 17)
     
@@ -108,14 +130,39 @@ class Tile(BaseTile):
     @staticmethod
     def from_str(tilestr):
         """Create a MODIS tile from a tile text string."""
-        if len(tilestr) is not 6 or tilestr[0] is not 'h' or tilestr[
-            3] is not 'v':
+        try:
+            h, v = _str_tiles_[tilestr]
+        except KeyError:
             raise ValueError("Invalid MODIS Tile text specification: '{}'"
-                             .format(tilestr))
-        return Tile(h=int(tilestr[1:3]), v=int(tilestr[4:6]))
+                             .format(tilestr)) from None
+        return _tile(h, v)
     
+    @staticmethod
+    def from_strs(tilestrs):
+        """Parse many 'hXXvYY' tile strings in one vectorized pass.
+
+        Returns an HVPair of integer index arrays (not Tile objects);
+        at bulk-ingestion scale the per-string indexing and int() calls
+        of from_str dominate, so the digits are extracted directly from
+        a packed byte buffer instead.
+        """
+        n = len(tilestrs)
+        buf = ''.join(tilestrs).encode('ascii')
+        arr = np.frombuffer(buf, dtype=np.uint8)
+        if arr.size != 6 * n:
+            raise ValueError("Tile text specifications must be 6 characters.")
+        arr = arr.reshape(n, 6)
+        digits = arr[:, [1, 2, 4, 5]] - 48
+        if (not np.all(arr[:, 0] == ord('h')) or
+                not np.all(arr[:, 3] == ord('v')) or
+                np.any((digits < 0) | (digits > 9))):
+            raise ValueError("Invalid MODIS Tile text specification(s).")
+        h = digits[:, 0]*10 + digits[:, 1]
+        v = digits[:, 2]*10 + digits[:, 3]
+        return HVPair(h.astype(int), v.astype(int))
+
     def __str__(self):
-        return 'h' + str(self.h).zfill(2) + 'v' + str(self.v).zfill(2)
+        return _tile_strs_[(self.h, self.v)]
     
     def __repr__(self):
         return "modis.Tile(" + self.__str__() + ")"
@@ -128,30 +175,42 @@ class Tile(BaseTile):
     
     def locate(lat, lon):
         """Return the (h,v) indices of a coordinate."""
-        lat, lon = np.array(lat), np.array(lon)
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
         lat_per_tile = 180. / 18.
-        v = ((-lat + 90) // lat_per_tile).astype(int)
-        rlat = lat * (np.pi / 180.0)  # In radians
-        h = (((lon * np.cos(rlat)) + 180) // 10).astype(int)
-        if v.size == 1 and v.size > 1:
-            ret_v = np.empty_like(h)
-            ret_v[:] = int(v)
-        else:
-            ret_v = v
-        
-        return HVPair(h, ret_v)
+        v = ((-lat + 90) // lat_per_tile).astype(np.intp)
+        rlat = np.deg2rad(lat)
+        h = (((lon * np.cos(rlat)) + 180) // 10).astype(np.intp)
+        # Align shapes so e.g. scalar lat broadcasts against array lon.
+        h, v = np.broadcast_arrays(h, v)
+        return HVPair(h, v)
+
+
+@functools.lru_cache(maxsize=1024)
+def _tile(h, v):
+    """Memoized Tile factory. Only 36x18 (h,v) pairs exist, and tiles
+    are immutable, so paths sharing a tile share one object."""
+    return Tile(h=h, v=v)
+
+
+# The MODIS filename scheme, e.g. MCD43A3.A2015001.h21v09.005.<ts>.hdf
+# One precompiled match replaces the split/int chain per path.
+_fname_pattern_ = re.compile(
+    r'(M[OCY]D\w+)\.A(\d{4})(\d{3})\.h(\d{2})v(\d{2})\.(\d{3})\.\d+\.hdf$')
 
 
 class File(BaseFile):
     """A MODIS level 3 File."""
-    
+
+    __slots__ = ()
     _fields = ('product', 'date', 'tile')
     _is_deterministic = False
-    
+
     def __init__(self, product, date, tile):
         File.validate(product, date, tile)
         self._product, self._date, self._tile = product, date, tile
-    
+        super().__init__()
+
     @staticmethod
     def from_path(path):
         is_local = not path.startswith(('http://', 'ftp://'))
@@ -159,15 +218,16 @@ class File(BaseFile):
             fname = path.split('/')[-1]
         else:
             fname = os.path.split(path)[-1]
-        
-        spl = fname.split('.')
-        assert len(spl) is 6
-        product = Product('.'.join((spl[0], spl[3])))
-        dstr = spl[1]
-        yr, doy = int(dstr[1:5]), int(dstr[5:8])
-        date = doy_to_datetime(yr, doy)
-        tile = Tile.from_str(spl[2])
-        
+
+        m = _fname_pattern_.match(fname)
+        if m is None:
+            raise ValueError(
+                'Not a recognized MODIS filename: {}'.format(fname))
+        name, yr, doy, h, v, version = m.groups()
+        product = _product(name + '.' + version)
+        date = doy_to_datetime(int(yr), int(doy))
+        tile = _tile(int(h), int(v))
+
         File.validate(product, date, tile)
         f = File(product, date, tile)
         f._path = path[:]  # Want a copy
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from .file import File
 from ...utils import list_links, psv_date, date_to_psv
 
@@ -49,17 +51,25 @@ def available_files(prod, dates=None, tiles=None, exact_dates=False):
     else:
         ad = available_dates(prod, dates=dates)
     
-    af = []
-    for d in sorted(ad):
-        #print("Searching for files on", d, end="\r")
-        print(ad[d])
-        all_filenames = [l for l in list_links(ad[d]) if l.endswith('.hdf')]
-        files = [File.from_path('/'.join([ad[d], f]))
-            for f in all_filenames]
+    def files_on_date(d):
+        files = [File.from_path('/'.join([ad[d], l]))
+                 for l in list_links(ad[d]) if l.endswith('.hdf')]
         if dates is not None:
             files = [f for f in files if f.date in dates]
         if tiles is not None:
             files = [f for f in files if f.tile in tiles]
-        af.extend(files)
+        return files
+
+    days = sorted(ad)
+    af = []
+    if len(days) > 1:
+        # One listing request per date folder; fetch them concurrently
+        # since each is an independent, latency-bound page load.
+        with ThreadPoolExecutor(max_workers=min(8, len(days))) as ex:
+            for files in ex.map(files_on_date, days):
+                af.extend(files)
+    else:
+        for d in days:
+            af.extend(files_on_date(d))
     return af
 
@@ -1,5 +1,9 @@
 import os
 
+from .file import File, get_product_folder
+from ...utils import date_to_psv
+
+
 def has_modlist(modfolder,prod,date):
     """Check if a modfolder/prodfolder/datefolder has a modlist.
 
@@ -15,15 +19,12 @@ def has_modlist(modfolder,prod,date):
         True if modfolder/prodfolder/datefolder has a .modlist
         False if modlist does not exist or datefolder or prodfolder do not exist.
     """
-    fullpath = os.path.join(modfolder,str(prod),date_to_psv(date))
-    if os.path.exists(fullpath):
-        files = os.listdir(fullpath)
-        if '.modlist' in files:
-            return os.path.join(fullpath,'.modlist')
-        else:
-            return False
-    else:
-        return False
+    # Stat the one path directly instead of listing the whole folder.
+    modlist = os.path.join(get_product_folder(modfolder, prod),
+                           date_to_psv(date), '.modlist')
+    if os.path.isfile(modlist):
+        return modlist
+    return False
 
 
 def remove_modlist(toppath,prod,date):
@@ -38,27 +39,26 @@ def create_modlist(modfolder,prod,date,list_of_modisFiles):
     NOTES:
         Will create the prodfolder and datefolder if they do not exist.
     '''
-    datefolder = os.path.join(modfolder,str(prod),date_to_psv(date))
+    datefolder = os.path.join(get_product_folder(modfolder, prod),
+                              date_to_psv(date))
     if not os.path.exists(datefolder):
         os.makedirs(datefolder)
 
-    filename = '.modlist'
-    modlist_file = open(os.path.join(datefolder,filename),'w')
-    for f in list_of_modisFiles: # Writes nothing if list is empty
-        modlist_file.write(str(f)+'\n')
-    modlist_file.close()
+    with open(os.path.join(datefolder, '.modlist'), 'w') as modlist_file:
+        # One write; these lists are at most a few hundred lines.
+        modlist_file.write(''.join(f.path + '\n' for f in list_of_modisFiles))
 
 
 def read_modlist(exactpath):
     '''Read a .modlist file.'''
     if not os.path.exists(exactpath) or not exactpath.endswith('.modlist'):
-        raise ValueError('A .modlist does not exist in this folder:['+
-                            modfolder+','+str(prod)+','+date+']')
-
-    fmodlist = open(exactpath,'r')
-    files=[File(f.strip()) for f in fmodlist]
-    fmodlist.close()
-    for f in files:
-        assert(f.is_valid)
-    
-    return files
\ No newline at end of file
+        raise ValueError('A .modlist does not exist at: {}'.format(exactpath))
+
+    # These files are small, so one read + splitlines beats buffered
+    # per-line iteration; from_path parses each line with the shared
+    # filename regex and the memoized product/tile factories, and
+    # marks the resulting Files valid.
+    with open(exactpath) as fmodlist:
+        lines = fmodlist.read().splitlines()
+
+    return [File.from_path(line) for line in lines if line]
@@ -2,12 +2,14 @@ from ..utils import date_to_doy
 from ..product import BaseProduct
 from ..file import BaseFile
 from ..base import Range
-from ..utils import list_files
+from ..utils import iter_files
+from concurrent.futures import ThreadPoolExecutor
 
 import os
+import re
 import datetime
+import functools
 import numpy as np
-import calendar
 
 
 _valid_products_ = ['3B42','3B42_daily','3B43']
@@ -23,7 +25,9 @@ def is_product_name(prod):
 
 class Product(BaseProduct):
     """A TRMM data product."""
-    
+
+    __slots__ = ()
+
     def __init__(self,product,version=7):
         """Build a TRMM file from a requirement."""
         if not is_product_name(product):
@@ -62,6 +66,7 @@ _6A_start_ = datetime.datetime(2007,5,1)
 class File(BaseFile):
     """A TRMM file."""
     
+    __slots__ = ()
     _fields = ('product', 'date')
     _is_deterministic = True
     _platform = 'TRMM'
@@ -83,7 +88,10 @@ class File(BaseFile):
         
         try:
             assert issubclass(type(date), datetime.date) or date is None
-            date = datetime.datetime.fromordinal(date.toordinal())
+            if not isinstance(date, datetime.datetime):
+                # Promote a plain date to midnight; a datetime keeps
+                # its time (3B42 files are 3-hourly).
+                date = datetime.datetime.fromordinal(date.toordinal())
             self._date = date
         except AssertionError:
             raise TypeError('date must be a datetime.date[time] or None')
@@ -104,66 +112,15 @@ class File(BaseFile):
         product : trmm.Product
         date : datetime.datetime
         protocol : ['http'] | ['ftp']
-        
+
         Notes
         -----
         Only Level 3 products are supported (and assumed).
+        Results are memoized -- batch download plans re-determine the
+        same (product, date) pairs repeatedly, and the dozen string
+        operations below run once per distinct request.
         """
-        if protocol=='http':
-            base = _base_http_
-        elif protocol=='ftp':
-            base = _base_ftp_
-        else:
-            raise ValueError("protocol must be 'http' or 'ftp'.")
-
-        yr, mo = str(date.year).zfill(4), str(date.month).zfill(2)
-        dy = str(date.day).zfill(2)
-        roll_yr, roll_doy = trmm_3B4X_doy(date)
-        roll_yr_short = roll_yr
-
-        level = 'L'+str(product.level) # 'L1','L2' or 'L3'
-        ver = str(product.version)
-        prod = product.name
-
-        if product.name == '3B42':
-            if product.version == 6:
-                prod += '.6'
-                yr = yr[2:]
-                hr = str(date.hour)
-                if date >= _6A_start_:
-                    ver += 'A'
-
-            elif product.version == 7:
-                if date in _7A_bounds_:
-                    ver += 'A'
-                hr = str(date.hour).zfill(2)
-
-            fname = '.'.join([product.name,yr+mo+dy,hr,ver,'HDF.Z'])
-            return '/'.join([protocol+base,TRMM_+level,TRMM_+prod,roll_yr,roll_doy,fname])
-
-        elif product.name == '3B42_daily':
-            if product.version == 6:
-                prod += '.6'
-
-            fname = '.'.join([product.name,yr,mo,dy,ver,'bin'])
-            return '/'.join([protocol+base,TRMM_+level,TRMM_+prod,roll_yr,roll_doy,fname])
-
-        elif product.name == '3B43':
-            if product.version == 6:
-                prod += '.6'
-                short_yr = yr[2:]
-                if date >= _6A_start_:
-                    ver += 'A'
-
-            elif product.version == 7:
-                short_yr = yr
-                if date in _7A_bounds_:
-                    ver += 'A'
-
-            doy = str(date_to_doy(date))
-            fname = '.'.join([product.name,short_yr+mo+dy,ver,'HDF'])
-
-        return '/'.join([protocol+base,TRMM_+level,TRMM_+prod,yr,doy.zfill(3),fname])
+        return _determine_path(product, date, protocol)
 
 
     @staticmethod
@@ -175,39 +132,37 @@ class File(BaseFile):
         else:
             loc, fname = True, os.path.split(path)[-1]
 
-        spl = fname.split('.')
-        prod = spl[0]
-
-        def guess_century(dstr):
-            if len(dstr) is 6: # We have the short year convention
-                if int(dstr[:2]) > 98:
-                    dstr = '19'+dstr
-                else:
-                    dstr = '20'+dstr
-            return dstr
-
-        if prod == '3B42':
-            dstr = guess_century(spl[1])
+        # One pass of the compiled pattern instead of splitting the
+        # name and branching through per-product int() chains.
+        m = _fname_pattern_.match(fname)
+        if m is None:
+            raise ValueError(
+                'Not a recognized TRMM filename: {}'.format(fname))
+
+        prod = m.group('daily') or m.group('prod')
+        hr = m.group('hr')
+        if prod == '3B42_daily':
+            date = datetime.datetime(int(m.group('y')), int(m.group('mo')),
+                                     int(m.group('d')))
+        elif prod == '3B42':
+            if hr is None:
+                raise ValueError(
+                    '3B42 filename is missing the hour: {}'.format(fname))
+            dstr = _guess_century(m.group('dstr'))
             date = datetime.datetime(int(dstr[:4]), int(dstr[4:6]),
-                                     int(dstr[6:]), int(spl[2][:2]))
-            ver = int(spl[3][0])
-
-        elif prod == '3B42_daily':
-            dstrs = spl[1:4]
-            date = datetime.datetime(int(dstrs[0]), int(dstrs[1]), int(dstrs[2]))
-            ver = int(spl[4][0])
-
-        elif prod == '3B43':
-            dstr = guess_century(spl[1])
-            date = datetime.datetime(int(dstr[:4]), int(dstr[4:6]), int(dstr[6:]))
-            ver = int(spl[2][0])
-        else:
-            raise ValueError('prod str "{}" is not supported'.format(prod))
-        
-        f = File(Product(prod, version=ver), date=date)
+                                     int(dstr[6:]), int(hr))
+        else:  # 3B43
+            if hr is not None:
+                raise ValueError(
+                    'Unexpected hour field in 3B43 filename: {}'.format(fname))
+            dstr = _guess_century(m.group('dstr'))
+            date = datetime.datetime(int(dstr[:4]), int(dstr[4:6]),
+                                     int(dstr[6:]))
+
+        f = File(Product(prod, version=int(m.group('ver'))), date=date)
         f._path = path[:]
         f._is_valid = True
-        f._is_local = True
+        f._is_local = loc
         return f
 
 
@@ -250,23 +205,14 @@ class File(BaseFile):
         elif self.product.name == '3B43':
             data *= hours_in_month(self.date.year,self.date.month)
 
-        # Set missing data
-        data[data < 0] = np.nan
+        # Set missing data; putmask skips the boolean fancy-index
+        # machinery on this hot path.
+        np.putmask(data, data < 0, np.nan)
         return data
 
     def read_bin(self):
         """Only call this if this File has a .bin extension."""
-        t = np.flipud(np.fromfile(self.path, dtype=np.float32,
-                      count=np.prod(self.shape)).byteswap().reshape(self.shape))
-        shift = self.shape[1] / 2 # Shift this into TRMM reference (lon:[-180,180])
-
-        # Doing it this way because `np.roll` wants to convert 'float64'->'int64'
-        #t = np.roll(t,shift,axis=1,dtype='float32')
-
-        t = np.hstack([t[:, shift:], t[:, :shift]])
-
-        t[t < 0] = np.nan  # Negative rainfall values are invalid
-        return t
+        return read_bin(self.path, self.shape)
 
     def read_hdf(self):
         import gdal
@@ -289,6 +235,86 @@ class File(BaseFile):
         raise NotImplementedError('Cannot unzip compressed HDF.')
 
 
+@functools.lru_cache(maxsize=4096)
+def _determine_path(product, date, protocol):
+    """Cached worker behind File.determine."""
+    if protocol=='http':
+        base = _base_http_
+    elif protocol=='ftp':
+        base = _base_ftp_
+    else:
+        raise ValueError("protocol must be 'http' or 'ftp'.")
+
+    yr, mo = str(date.year).zfill(4), str(date.month).zfill(2)
+    dy = str(date.day).zfill(2)
+    roll_yr, roll_doy = trmm_3B4X_doy(date)
+    roll_yr_short = roll_yr
+
+    level = 'L'+str(product.level) # 'L1','L2' or 'L3'
+    ver = str(product.version)
+    prod = product.name
+
+    if product.name == '3B42':
+        if product.version == 6:
+            prod += '.6'
+            yr = yr[2:]
+            hr = str(date.hour)
+            if date >= _6A_start_:
+                ver += 'A'
+
+        elif product.version == 7:
+            if date in _7A_bounds_:
+                ver += 'A'
+            hr = str(date.hour).zfill(2)
+
+        fname = '.'.join([product.name,yr+mo+dy,hr,ver,'HDF.Z'])
+        return '/'.join([protocol+base,TRMM_+level,TRMM_+prod,roll_yr,roll_doy,fname])
+
+    elif product.name == '3B42_daily':
+        if product.version == 6:
+            prod += '.6'
+
+        fname = '.'.join([product.name,yr,mo,dy,ver,'bin'])
+        return '/'.join([protocol+base,TRMM_+level,TRMM_+prod,roll_yr,roll_doy,fname])
+
+    elif product.name == '3B43':
+        if product.version == 6:
+            prod += '.6'
+            short_yr = yr[2:]
+            if date >= _6A_start_:
+                ver += 'A'
+
+        elif product.version == 7:
+            short_yr = yr
+            if date in _7A_bounds_:
+                ver += 'A'
+
+        doy = str(date_to_doy(date))
+        fname = '.'.join([product.name,short_yr+mo+dy,ver,'HDF'])
+
+    return '/'.join([protocol+base,TRMM_+level,TRMM_+prod,yr,doy.zfill(3),fname])
+
+
+# The TRMM filename grammar, all three products in one pattern:
+#   3B42.<yyyymmdd|yymmdd>.<hh>.<ver>.HDF[.Z]
+#   3B42_daily.<yyyy>.<mm>.<dd>.<ver>.bin
+#   3B43.<yyyymmdd|yymmdd>.<ver>.HDF
+_fname_pattern_ = re.compile(
+    r'(?:(?P<daily>3B42_daily)\.(?P<y>\d{4})\.(?P<mo>\d{2})\.(?P<d>\d{2})'
+    r'|(?P<prod>3B42|3B43)\.(?P<dstr>\d{8}|\d{6})(?:\.(?P<hr>\d{1,2}))?)'
+    r'\.(?P<ver>\d)A?\.(?:HDF(?:\.Z)?|bin)$')
+
+
+def _guess_century(dstr):
+    """Expand a short-year yymmdd date string to yyyymmdd."""
+    if len(dstr) == 6:  # We have the short year convention
+        if int(dstr[:2]) > 98:
+            dstr = '19'+dstr
+        else:
+            dstr = '20'+dstr
+    return dstr
+
+
 def is_trmm_datestr(s):
     '''Check if the datestring matches the standard TRMM format.'''
     if not len(s) == 8:
@@ -302,17 +328,25 @@ def is_trmm_datestr(s):
         return False
 
 
+def _safe_from_path(path):
+    """File.from_path, returning None instead of raising for paths
+    that do not name a usable TRMM file."""
+    try:
+        return File.from_path(path)
+    except Exception:
+        return None
+
+
 def files_in_folder(folder,recursive=False):
     """List the valid TRMM files in a folder, in chronological order."""
-    all_files = list_files(folder, recursive=recursive)
-    trmm_files = []
-    for f in all_files:
-        try:
-            tf = File.from_path(f)
-            trmm_files.append(tf)
-        except:
-            pass
-    return sorted([f for f in trmm_files if f.is_valid], key=lambda x: x.date)
+    # iter_files yields paths as the tree is scanned, so nothing is
+    # materialized beyond the TRMM files themselves. from_path marks
+    # everything it returns valid, so no second validity pass needed.
+    trmm_files = [f for f in map(_safe_from_path,
+                                 iter_files(folder, recursive=recursive))
+                  if f is not None]
+    trmm_files.sort(key=lambda x: x.date)
+    return trmm_files
 
 
 def have_files(toppath, prod, dates=None, hours=None):
@@ -341,9 +375,43 @@ def which_pixel(coord):
     return (ypix,xpix)
 
 
+def which_pixels(lats, lons):
+    """Vectorized which_pixel for arrays of coordinates.
+
+    Arguments
+    ---------
+    lats, lons : array-like, broadcastable against each other.
+
+    Returns
+    -------
+    (ypix, xpix) - two int32 numpy arrays, matching what which_pixel
+    returns for each coordinate individually but computed in one
+    vectorized pass instead of a Python loop per point.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if np.any(np.abs(lats) >= 50):
+        raise ValueError('Coordinate lat out of bounds (-50,50).')
+    if np.any(np.abs(lons) > 180):
+        raise ValueError('Coordinate lon is out of bounds [-180,180]')
+    ypix = np.rint((-lats + 49.875) / 0.25).astype(np.int32)
+    xpix = np.rint((lons + 179.875) / 0.25).astype(np.int32)
+    ypix, xpix = np.broadcast_arrays(ypix, xpix)
+    return (ypix, xpix)
+
+
+# Hours per month in a non-leap year; February gains 24 in leap years.
+_hours_per_month_ = (744, 672, 744, 720, 744, 720, 744, 744, 720, 744, 720, 744)
+
+
 def hours_in_month(year,month):
     '''Return the number of hours in a month.'''
-    return calendar.monthrange(year,month)[1]* 24
+    # Table lookup instead of calendar.monthrange, which builds a
+    # weekday as well; this runs once per file when scaling 3B43.
+    hours = _hours_per_month_[month - 1]
+    if month == 2 and (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        hours += 24
+    return hours
 
 
 def read(f,negs=None):
@@ -361,11 +429,37 @@ def read(f,negs=None):
         raise Exception('Unknown product')
 
     if negs is not None:
-        data[data<0] = negs
+        np.putmask(data, data < 0, negs)
 
     return data
 
 
+def _read_into(f, out):
+    out[...] = f.read()
+
+
+def read_many(files):
+    """Read a batch of local TRMM Files into one stacked array.
+
+    Returns a (len(files), 400, 1440) float32 ndarray with files[i] at
+    out[i]. The output is allocated once up front and each read writes
+    straight into its slice, so building a time stack never holds
+    per-file temporaries; reads run on a small thread pool since the
+    file I/O dominates and releases the GIL.
+    """
+    files = list(files)
+    out = np.empty((len(files),) + shape(), dtype=np.float32)
+    if not files:
+        return out
+    if len(files) == 1:
+        _read_into(files[0], out[0])
+        return out
+    with ThreadPoolExecutor(max_workers=min(16, len(files))) as ex:
+        # Iterating out yields the (400, 1440) slice views in order.
+        list(ex.map(_read_into, files, out))
+    return out
+
+
 def shape():
     '''Return the shape of the TRMM domain.'''
     return (400,1440)
@@ -382,50 +476,71 @@ def bbox(y,x):
 
 def grid():
     """Find the geographic coordinates of the TRMM domain.
-    
+
     Returns
     -------
     A dict with keys 'lat' and 'lon', each with shape (400,1440).
+    Both are read-only broadcast views of cached 1-D vectors (every
+    row of 'lon' and every column of 'lat' are identical); call
+    .copy() if you need a writable array.
     """
-    nlon = 1440
-    nlat = 400
-    xs = 0.25
-    ys = -0.25
-    x0 = -180. + (xs/2.)
-    y0 = 50. + (ys/2.)
-    lons = xs * np.arange(nlon) + x0
-    lats = ys * np.arange(nlat) + y0
-    lons,lats = np.meshgrid(lons, lats)
-    return {'lat':lats, 'lon':lons}
+    return {'lat': np.broadcast_to(_lat_col()[:, None], shape()),
+            'lon': np.broadcast_to(_lon_row(), shape())}
+
 
+def grid_1d():
+    """The 1-D (lats, lons) pixel-center vectors of the TRMM domain.
+    Prefer this over grid() when the caller broadcasts anyway."""
+    return _lat_col(), _lon_row()
 
+
+# The domain is fixed, so both coordinate vectors are computed once
+# and shared read-only.
+
+@functools.lru_cache(maxsize=1)
 def _lon_row():
-    nlon = 1440
-    xs = 0.25
-    x0 = -180. + (xs/2.)
-    lons = xs * np.arange(nlon) + x0
+    lons = 0.25 * np.arange(1440) + (-180. + 0.125)
+    lons.setflags(write=False)
     return lons
 
 
+@functools.lru_cache(maxsize=1)
+def _lat_col():
+    lats = -0.25 * np.arange(400) + (50. - 0.125)
+    lats.setflags(write=False)
+    return lats
+
+
 def LST_offset():
-    raise NotImplementedError
-    # return a 400x1440 numpy array of timedeltas reflecting how
-    # Local Standard Time differs from UTC (the TRMM timestamp)
-    lons = _lon_row() # We only need the first row
-    offset_hrs = (lons/180.0) * 12
-    to_timedelta = np.vectorize(lambda h: datetime.timedelta(hours=h))
-    timeoffset = to_timedelta(offset_hrs)
-    return timeoffset
+    """How Local Standard Time differs from UTC (the TRMM timestamp).
+
+    Returns a read-only (400,1440) timedelta64[ns] array. The offset
+    depends only on longitude, so it is one computed row broadcast
+    down the domain -- integer timedelta64 math, not an object array
+    of datetime.timedeltas.
+    """
+    lons = _lon_row()  # We only need the first row
+    offset_ns = (lons / 180.0 * 12 * 3_600_000_000_000).astype(np.int64)
+    row = offset_ns.view('timedelta64[ns]')
+    return np.broadcast_to(row, shape())
 
 
 def read_bin(path, shape, shift=True):
     """Only call this if this File has a .bin extension."""
-    t = np.flipud(np.fromfile(path, dtype=np.float32,
-                  count=np.prod(shape)).byteswap().reshape(shape))
+    t = np.fromfile(path, dtype=np.float32, count=np.prod(shape))
+    t.byteswap(inplace=True)  # Fresh buffer, so swap without a copy
+    t = t.reshape(shape)
     if shift is True:
-        nshift = shape[1] / 2  # Shift this into TRMM reference (lon:[-180,180])
-        # Doing it this way because np.roll wants to convert float64 to int64
-        # t = np.roll(t,shift,axis=1, dtype='float32')
-        t = np.hstack([t[:, nshift:], t[:, :nshift]])
-    t[t < 0] = np.nan  # Negative rainfall values are invalid
+        # Shift into the TRMM reference (lon:[-180,180]) while
+        # materializing the flipud view: two copies into one
+        # preallocated output instead of the old hstack, which built a
+        # second full array (and indexed with a float under Python 3).
+        nshift = shape[1] // 2
+        out = np.empty(shape, dtype=np.float32)
+        out[:, :shape[1] - nshift] = t[::-1, nshift:]
+        out[:, shape[1] - nshift:] = t[::-1, :nshift]
+        t = out
+    else:
+        t = t[::-1].copy()
+    np.putmask(t, t < 0, np.nan)  # Negative rainfall values are invalid
     return t
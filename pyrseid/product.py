@@ -6,7 +6,11 @@ from .base import Range
 
 """Base class for platfrom specific data products."""
 class BaseProduct:
-    
+    # Products are small value objects created per file-listing row;
+    # slots drop the per-instance dict. Subclasses declare __slots__
+    # with any extra attributes they add.
+    __slots__ = ('_name', '_version', '_platform', '_level', '_daterange')
+
     def __init__(self, name=None, version=None, platform=None,
                  level=None, daterange=Range(None, None)):
         self._name = name
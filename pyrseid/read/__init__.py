@@ -65,41 +65,123 @@ def read_with_h5py(filename, field):
     return data
 
 
-def read_hdf(file, field):
-    """Read a file using either the gdal, pyhdf or h5py backend."""
+def read_slice_with_pyhdf(filename, field, slc):
+    from pyhdf.SD import SD
+    ds = SD(filename)
+    try:
+        return ds.select(field)[slc]
+    finally:
+        ds.end()
+
+
+def read_slice_with_h5py(filename, field, slc):
+    import h5py
+    ds = h5py.File(filename)
+    try:
+        return ds[field][slc]
+    finally:
+        ds.close()
+
+
+def read_slice(file, field, slc=slice(None)):
+    """Read only a hyperslab of one sub-dataset.
+
+    slc is anything the dataset accepts as an index (a slice, a tuple
+    of slices, ...). The selection is pushed down to the backend so
+    only the requested region is read from disk -- callers working on
+    a small window avoid pulling the full grid into memory first.
+    """
     filename = file.path if issubclass(type(file), BaseFile) else file
-    errors = [None, None, None]
+    errors = [None, None]
     try:
-        data = read_with_gdal(filename, field)
-        return data
-    except Exception as gdal_error:
-        errors[0] = gdal_error
-    
+        return read_slice_with_pyhdf(filename, field, slc)
+    except Exception as pyhdf_error:
+        errors[0] = pyhdf_error
+
+    try:
+        return read_slice_with_h5py(filename, field, slc)
+    except Exception as h5py_error:
+        errors[1] = h5py_error
+
+    raise RuntimeError(("Could not read data with either pyhdf or h5py "
+                       "backend. Make sure one of these libraries is "
+                       "installed. The errors given by each library are: \n"
+                       "pyhdf:\n"
+                       "   {}\n"
+                       "h5py:\n"
+                       "   {}\n").format(*errors))
+
+
+def read_many_with_pyhdf(filename, fields):
+    from pyhdf.SD import SD
+    ds = SD(filename)
     try:
-        data = read_with_pyhdf(filename, field)
-        return data
+        return {f: ds.select(f)[:] for f in fields}
+    finally:
+        ds.end()
+
+
+def read_many_with_h5py(filename, fields):
+    import h5py
+    ds = h5py.File(filename)
+    try:
+        return {f: ds[f][:] for f in fields}
+    finally:
+        ds.close()
+
+
+def read_many_hdf(file, fields):
+    """Read several sub-datasets from one file with a single open.
+
+    Equivalent to calling read_hdf once per field, but the file handle
+    (and its attribute enumeration) is set up once instead of
+    len(fields) times. Returns a dict {field: ndarray}.
+    """
+    filename = file.path if issubclass(type(file), BaseFile) else file
+    errors = [None, None]
+    try:
+        return read_many_with_pyhdf(filename, fields)
     except Exception as pyhdf_error:
-        errors[1] = pyhdf_error
-    
+        errors[0] = pyhdf_error
+
     try:
-        data = read_with_h5py(filename, field)
-        return data
+        return read_many_with_h5py(filename, fields)
     except Exception as h5py_error:
-        errors[2] = h5py_error
-    
-    raise RuntimeError(("Could not read data with either gdal or pyhdf backend. "
-                       "Make sure one of these libraries is installed. The errors "
-                       "given by each library are: \n"
-                       "gdal:\n"
-                       "   {}"
+        errors[1] = h5py_error
+
+    raise RuntimeError(("Could not read data with either pyhdf or h5py "
+                       "backend. Make sure one of these libraries is "
+                       "installed. The errors given by each library are: \n"
                        "pyhdf:\n"
                        "   {}\n"
                        "h5py:\n"
                        "   {}\n").format(*errors))
 
 
+def read_hdf(file, field):
+    """Read a file using either the gdal, pyhdf or h5py backend."""
+    filename = file.path if issubclass(type(file), BaseFile) else file
+    # Try the backends in order; errors are only collected (and the
+    # failure message only assembled) on the path where every backend
+    # has already failed.
+    errors = []
+    for backend, reader in (('gdal', read_with_gdal),
+                            ('pyhdf', read_with_pyhdf),
+                            ('h5py', read_with_h5py)):
+        try:
+            return reader(filename, field)
+        except Exception as error:
+            errors.append((backend, error))
+
+    raise RuntimeError("Could not read data with the gdal, pyhdf or h5py "
+                       "backend. Make sure one of these libraries is "
+                       "installed. The errors given by each library are: \n" +
+                       ''.join('{}:\n   {}\n'.format(backend, error)
+                               for backend, error in errors))
+
+
 def read(file, field, fillfunc=None, fillval=np.nan, astype=None,
-  correction_factor=None):
+  correction_factor=None, slc=None):
     """Read an data file as a numpy ndarray, with possible conversions.
     
     Requires GDAL or HDF4 support for hdf files.
@@ -123,7 +205,11 @@ def read(file, field, fillfunc=None, fillval=np.nan, astype=None,
     correction_factor - [None] | float
             What to multiply the input dataset by after converting to
             return type.
-    
+    slc : [None] | slice | tuple(slice)
+        If given, only this hyperslab of the sub-dataset is read (see
+        read_slice); fillfunc/astype/correction then touch just the
+        selection.
+
     Returns
     -------
     data - numpy ndarray
@@ -142,15 +228,22 @@ def read(file, field, fillfunc=None, fillval=np.nan, astype=None,
     desired type to fill (such as with np.nan, which is only valid in
     floating point data).
     """
-    data = read_hdf(file, field)
-    
-    if fillfunc is not None:       #[1]
+    if slc is None:
+        data = read_hdf(file, field)
+    else:
+        data = read_slice(file, field, slc)
+
+    # The raw array is freshly read and never aliased, so the type
+    # conversion can skip copying and the correction and fill can run
+    # in place -- one trip through memory each instead of allocating
+    # intermediates (these arrays run to hundreds of MB).
+    if fillfunc is not None:           #[1]
         to_fill = fillfunc(data)
     if astype is not None:
-        data = data.astype(astype) #[2]
+        data = data.astype(astype, copy=False) #[2]
     if correction_factor is not None:
-        data *= correction_factor
-    if fillfunc is not None:       #[3]
-        data[to_fill] = fillval
-    
+        np.multiply(data, correction_factor, out=data)
+    if fillfunc is not None:           #[3]
+        np.copyto(data, fillval, where=to_fill)
+
     return data
\ No newline at end of file
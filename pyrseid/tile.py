@@ -5,8 +5,16 @@ Classes representing tiles/granules and swaths of tiles.
 import sys
 sys.dont_write_bytecode = True
 
+import numpy as np
+
 class BaseTile:
     """Represents a Granule or Tile of data with two indices (v,h)."""
+
+    # Tiles are created in bulk (one per file in a catalog scan), so
+    # store the two indices in slots rather than a per-instance dict.
+    # Subclasses declare __slots__ with any extra attributes they add.
+    __slots__ = ('_v', '_h', '_key')
+
     def __init__(self,v,h):
         try: # Check horizontal component
             assert(h in self._hrange)
@@ -25,7 +33,11 @@ class BaseTile:
             raise ValueError("'_vrange' member must be implemented by inheriting class.")
         
         self._v,self._h = v,h
-        
+        # Packed key: hashing, equality and ordering below are single
+        # int compares instead of building a tuple per operation, and
+        # (v, h) tuple order is preserved since h < 2**16.
+        self._key = (v << 16) | h
+
     @property
     def h(self):
         """Horizontal coordinates of a Tile."""
@@ -40,25 +52,25 @@ class BaseTile:
         return 'Tile(h='+str(h)+',v='+str(v)+')'
     
     def __eq__(self, other):
-        return self is other or (self.h==other.h and self.v==other.v)
-    
+        return self is other or self._key == other._key
+
     def __ne__(self,other):
         return not self==other
-    
+
     def __ge__(self, other):
-        return (self.v, self.h) >= (other.v, other.h)
-    
+        return self._key >= other._key
+
     def __le__(self, other):
-        return not self >= other
-    
+        return self._key <= other._key
+
     def __gt__(self, other):
-        return (self.v, self.h) >= (other.v, other.h)
-    
+        return self._key > other._key
+
     def __lt__(self, other):
-        return not self > other
-    
+        return self._key < other._key
+
     def __hash__(self):
-        return hash((self.h,self.v))
+        return self._key
     
 
 class TileRange:
@@ -83,12 +95,25 @@ class TileRange:
     def __repr__(self):
         return self.__str__()
     
+    def as_arrays(self):
+        """The (h, v) indices of the range as two int arrays.
+
+        Returns a meshgrid pair of shape (n_v, n_h). Bulk numeric
+        consumers (geometry math over tile indices) can use these
+        directly without constructing a Tile object per cell.
+        """
+        return np.meshgrid(np.arange(self.tiles[0].h, self.tiles[1].h+1),
+                           np.arange(self.tiles[0].v, self.tiles[1].v+1),
+                           indexing='xy')
+
     def to_list(self):
         '''Expand TileRange into a list of Tiles'''
-        return [self._type(h=h,v=v)
-                    for h in range(self.tiles[0].h,self.tiles[1].h+1)
-                        for v in range(self.tiles[0].v,self.tiles[1].v+1) ]
-    
+        hs, vs = self.as_arrays()
+        # Fortran-order ravel keeps the historical ordering (h outer,
+        # v inner).
+        return [self._type(h=int(h), v=int(v))
+                for h, v in zip(hs.ravel(order='F'), vs.ravel(order='F'))]
+
     def __iter__(self):
         """Return an iterator over all pixels."""
         return iter(self.to_list())
@@ -2,17 +2,29 @@
 Miscellaneous utility functions.
 """
 import os
+import re
 import pickle
 import datetime
+import functools
+import collections
+
+import numpy as np
 
 
 #=============================================================#
 #                      MISCELLANEOUS                          #
 #=============================================================#
 
+# The container types callers actually hand around.
+_sequence_types_ = (list, tuple, set, frozenset, range, np.ndarray)
+
+
 def is_sequence(x):
     """Is input a sequence or not?"""
-    return hasattr(x,'__iter__')
+    # One isinstance check against a concrete type tuple instead of a
+    # hasattr attribute lookup; this also stops classifying str (which
+    # has __iter__) as a sequence of Files.
+    return isinstance(x, _sequence_types_)
 
 
 def _bbox_contains(arr,val):
@@ -62,24 +74,44 @@ def list_files(directory, recursive=False):
     -----
     This function makes recursive function calls.
     """
+    return list(iter_files(directory, recursive=recursive))
+
+
+def iter_files(directory, recursive=False):
+    """Lazily yield the absolute file paths under a directory.
+
+    Same arguments and traversal as list_files, but yields paths as
+    the directory is scanned so large trees are never materialized at
+    once. Uses os.scandir, whose entries carry the file type from the
+    directory read itself -- no extra stat call per entry.
+    """
     if not os.path.exists(directory):
         raise FileNotFoundError('Base directory does not exist: {}'.format(
             directory))
     directory = os.path.abspath(directory)
-    all_files = []
     if not (recursive in {True, False} or type(recursive) is int):
-        print(recursive, type(recursive))
         raise TypeError('Recursive must be a bool {True, False} or an int.')
     if recursive is True:
         recursive = -1
-    for i in os.listdir(directory):
-        full_name = os.path.join(directory, i)
-        if os.path.isdir(full_name):
-            if recursive:
-                all_files.extend(list_files(full_name, recursive=recursive-1))
-        elif os.path.isfile(full_name):
-            all_files.append(full_name)
-    return all_files
+
+    def walk(root, depth):
+        # Iterative breadth-first walk: deep archives (e.g. yearly/doy
+        # trees) never touch the recursion limit, and symlinked
+        # directories are not followed, so loops cannot recurse
+        # forever.
+        queue = collections.deque([(root, depth)])
+        while queue:
+            path, depth = queue.popleft()
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth:
+                            queue.append((entry.path, depth-1))
+                    elif entry.is_file():
+                        yield entry.path
+
+    # Validation above runs eagerly; only the scan is deferred.
+    return walk(directory, recursive)
 
 
 #=============================================================#
@@ -148,26 +180,38 @@ def pretty_lon_print(lon):
 #                            DATES                            #
 #=============================================================#
 
+_psv_date_re_ = re.compile(r'(\d{4})\.(\d{2})\.(\d{2})$')
+
+
 def psv_date(s):
-    """Returns True if input is a period-separated date string.
+    """Parse a period-separated date string ('YYYY.MM.DD').
     Returns None if s is not a date string.
     """
-    import datetime
+    # psv_date is called once per candidate link/folder in listings;
+    # one compiled match rejects non-dates without raising.
+    m = _psv_date_re_.match(s)
+    if m is None:
+        return None
     try:
-        assert len(s) is 10
-        y, m, d = s.split('.')
-        return datetime.datetime(int(y), int(m), int(d))
-    except:
+        return datetime.datetime(int(m[1]), int(m[2]), int(m[3]))
+    except ValueError:  # Well-shaped but impossible, e.g. 2015.02.30
         return None
 
 def date_to_psv(d):
-    return '.'.join([str(d.year).zfill(4),
-                     str(d.month).zfill(2),
-                     str(d.day).zfill(2)])
+    # Called once per file in library enumeration; the format spec
+    # pads in C without the intermediate zfill strings.
+    return f"{d.year:04d}.{d.month:02d}.{d.day:02d}"
+
+@functools.lru_cache(maxsize=256)
+def _jan1_ordinal(year):
+    """Ordinal of January 1st; cached since date_to_doy runs once per
+    file over a handful of years."""
+    return datetime.date(year, 1, 1).toordinal()
+
 
 def date_to_doy(d):
     """Convert a datetime.date[time] to integer day of year (Jan. 1st = 1)"""
-    return (d - type(d)(d.year,1,1)).days + 1
+    return d.toordinal() - _jan1_ordinal(d.year) + 1
 
 
 def doy_to_datetime(year, doy):
@@ -179,22 +223,45 @@ def doy_to_datetime(year, doy):
 #                       HTML PARSING                          #
 #=============================================================#
 
-def list_links(url, subdir=False):
-    """List all links in a url. 
-    
+def list_links(url, subdir=False, prefix=None):
+    """Iterate over the links in a url.
+
     If subdir is True, then only links ending in '/' will
-    be returned.
+    be returned. If prefix is given, only links starting with it are
+    returned. Yields links lazily -- large directory listings (10k+
+    entries are common on data servers) are filtered as they are
+    scanned instead of being materialized into an intermediate list.
     """
-    import urllib.request, bs4
-    
+    import bs4
+
+    # Listing many date folders hits the same host repeatedly; the
+    # shared download session keeps that connection alive instead of
+    # paying a TCP/TLS handshake per page.
     try:
-        site = urllib.request.urlopen(url)
-    except:
+        from ..download import _get_session
+        response = _get_session().get(url)
+        response.raise_for_status()
+        html = response.text
+    except ImportError:  # requests not installed; plain urllib works
+        import urllib.request
+        try:
+            site = urllib.request.urlopen(url)
+        except:
+            raise RuntimeError("URL: {} does not exist".format(url))
+        html = site.read().decode('utf-8')
+    except Exception:
         raise RuntimeError("URL: {} does not exist".format(url))
-    
-    html = site.read().decode('utf-8')
     soup = bs4.BeautifulSoup(html, parse_only=bs4.SoupStrainer('a', href=True))
-    links = [l['href'] for l in soup.find_all('a', href=True)]
-    if subdir:
-        links = [l for l in links if l.endswith('/')]
-    return links
+
+    def links():
+        for a in soup.find_all('a', href=True):
+            href = a['href']
+            if subdir and not href.endswith('/'):
+                continue
+            if prefix is not None and not href.startswith(prefix):
+                continue
+            yield href
+
+    # The fetch above stays eager (bad urls raise here, not at first
+    # iteration); only the link scan is deferred.
+    return links()